@@ -5,6 +5,7 @@ Provides structured logging with different outputs for development and productio
 """
 
 import sys
+import traceback
 from pathlib import Path
 from typing import Any, Dict
 
@@ -12,6 +13,40 @@ from loguru import logger
 
 from .settings import get_settings
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to loguru's own serializer
+    orjson = None
+
+
+def _json_format(record: Dict[str, Any]) -> str:
+    """Serialize a record to one line of JSON with orjson, for the production sink."""
+    extra = {k: v for k, v in record["extra"].items() if k != "serialized"}
+    exception = record["exception"]
+    if exception is not None:
+        exception = {
+            "type": exception.type.__name__ if exception.type else None,
+            "value": str(exception.value),
+            # Full formatted traceback, as loguru's own serializer records it
+            "traceback": "".join(
+                traceback.format_exception(exception.type, exception.value, exception.traceback)
+            ),
+        }
+    record["extra"]["serialized"] = orjson.dumps(
+        {
+            "time": record["time"].isoformat(),
+            "level": record["level"].name,
+            "name": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+            "message": record["message"],
+            "extra": extra,
+            "exception": exception,
+        },
+        default=str,
+    ).decode()
+    return "{extra[serialized]}\n"
+
 
 def setup_logging() -> None:
     """Set up application logging configuration."""
@@ -29,13 +64,20 @@ def setup_logging() -> None:
             colorize=True,
         )
     else:
-        # Structured JSON logging for production
-        logger.add(
-            sys.stdout,
-            format="{time} | {level} | {name}:{function}:{line} | {message}",
-            level=settings.monitoring.log_level,
-            serialize=True,
-        )
+        # Structured JSON logging for production. Formatted records are handed to a
+        # background writer (enqueue) so callers never block on sink I/O.
+        if orjson is not None:
+            logger.add(
+                sys.stdout, format=_json_format, level=settings.monitoring.log_level, enqueue=True
+            )
+        else:
+            logger.add(
+                sys.stdout,
+                format="{time} | {level} | {name}:{function}:{line} | {message}",
+                level=settings.monitoring.log_level,
+                serialize=True,
+                enqueue=True,
+            )
 
     # File logging
     log_dir = Path("logs")
@@ -49,6 +91,7 @@ def setup_logging() -> None:
         format="{time} | {level} | {name}:{function}:{line} | {message}",
         backtrace=True,
         diagnose=True,
+        enqueue=True,
     )
 
     # Error logging
@@ -60,6 +103,7 @@ def setup_logging() -> None:
         format="{time} | {level} | {name}:{function}:{line} | {message}",
         backtrace=True,
         diagnose=True,
+        enqueue=True,
     )
 
     # Agent-specific logging
@@ -70,6 +114,7 @@ def setup_logging() -> None:
         rotation="1 day",
         retention="7 days",
         format="{time} | {level} | Agent: {extra[agent]} | {message}",
+        enqueue=True,
     )
 
     # API call logging
@@ -80,6 +125,7 @@ def setup_logging() -> None:
         rotation="1 day",
         retention="14 days",
         format="{time} | {level} | API: {extra[api]} | {message}",
+        enqueue=True,
     )
 
 
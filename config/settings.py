@@ -51,9 +51,14 @@ class MarketingAPISettings(BaseSettings):
 
     # Rate limiting
     apollo_rate_limit: int = Field(100, env="APOLLO_RATE_LIMIT")
+    builtwith_rate_limit: int = Field(60, env="BUILTWITH_RATE_LIMIT")
     hubspot_rate_limit: int = Field(100, env="HUBSPOT_RATE_LIMIT")
     salesforce_rate_limit: int = Field(100, env="SALESFORCE_RATE_LIMIT")
 
+    # Concurrent HubSpot requests allowed in flight; kept just under HubSpot's
+    # 10 requests per second
+    hubspot_max_inflight: int = Field(9, env="HUBSPOT_MAX_INFLIGHT")
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -5,20 +5,57 @@ Provides comprehensive lead enrichment, contact search, and company data retriev
 capabilities through the Apollo.io API.
 """
 
+import hashlib
+import json
+import random
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
 
-import requests
+import httpx
 from agno.tools import Toolkit, tool
 from loguru import logger
 
 from config.logging import log_api_call
 from config.settings import get_settings
 
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to full JSON parsing
+    ijson = None
 
-@dataclass
-class Contact:
+# Responses smaller than this are cheaper to parse in one go than to stream
+_STREAM_MIN_BYTES = 8 * 1024
+
+# JSON paths extracted from streamed people search results, mapped to Contact fields
+_PERSON_STREAM_FIELDS = {
+    "people.item.id": "id",
+    "people.item.first_name": "first_name",
+    "people.item.last_name": "last_name",
+    "people.item.name": "name",
+    "people.item.email": "email",
+    "people.item.title": "title",
+    "people.item.organization.name": "company_name",
+    "people.item.linkedin_url": "linkedin_url",
+    "people.item.phone": "phone",
+}
+_PAGINATION_KEYS = ("total_entries", "page", "per_page", "num_pages")
+
+# Retries allowed when Apollo answers 429 Too Many Requests
+_MAX_RETRIES = 3
+
+# Statuses with which Apollo rejects a request's parameters
+_REJECTED_PARAM_STATUSES = frozenset({400, 422})
+
+# Apollo's bulk enrichment endpoints accept at most this many records per call
+_BULK_BATCH_SIZE = 10
+
+
+class Contact(NamedTuple):
     """Contact data structure from Apollo."""
 
     id: Optional[str] = None
@@ -32,11 +69,10 @@ class Contact:
     phone: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in zip(self._fields, self) if v is not None}
 
 
-@dataclass
-class Company:
+class Company(NamedTuple):
     """Company data structure from Apollo."""
 
     id: Optional[str] = None
@@ -49,7 +85,91 @@ class Company:
     technologies: Optional[List[str]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in zip(self._fields, self) if v is not None}
+
+
+def _retry_after_seconds(response: httpx.Response, default: float) -> float:
+    """Read the Retry-After header (seconds or HTTP date), falling back to ``default``."""
+    retry_after = response.headers.get("Retry-After")
+    if not retry_after:
+        return default
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_person(person: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an Apollo person record to a contact dict."""
+    return Contact(
+        id=person.get("id"),
+        first_name=person.get("first_name"),
+        last_name=person.get("last_name"),
+        name=person.get("name"),
+        email=person.get("email"),
+        title=person.get("title"),
+        company_name=(person.get("organization") or {}).get("name"),
+        linkedin_url=person.get("linkedin_url"),
+        phone=person.get("phone"),
+    ).to_dict()
+
+
+def _parse_organization(org: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an Apollo organization record to a company dict."""
+    return Company(
+        id=org.get("id"),
+        name=org.get("name"),
+        domain=org.get("primary_domain"),
+        industry=(
+            org.get("primary_industry", {}).get("industry") if org.get("primary_industry") else None
+        ),
+        size=org.get("employee_count"),
+        location=(org.get("primary_phone", {}).get("source") if org.get("primary_phone") else None),
+        revenue=org.get("estimated_num_employees"),
+        technologies=[tech.get("name") for tech in org.get("technologies", [])],
+    ).to_dict()
+
+
+def _iter_streamed_people(stream: Any, pagination: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Incrementally parse a people search response, yielding contact dicts.
+
+    Only the fields in ``_PERSON_STREAM_FIELDS`` are kept, so nested objects such as
+    ``organization`` and ``employment_history`` are never materialized. Top-level
+    pagination values are written into ``pagination`` as they are encountered.
+    """
+    person = None
+    for prefix, event, value in ijson.parse(stream):
+        if prefix == "people.item":
+            if event == "start_map":
+                person = {}
+            elif event == "end_map":
+                yield Contact(**person).to_dict()
+                person = None
+        elif person is not None:
+            field_name = _PERSON_STREAM_FIELDS.get(prefix)
+            if field_name is not None and value is not None:
+                person[field_name] = value
+        elif prefix in _PAGINATION_KEYS and event == "number":
+            pagination[prefix] = int(value)
+
+
+def _canon_email(email: str) -> str:
+    """Normalize an email address so case/whitespace variants share a request key."""
+    return email.strip().lower()
+
+
+def _canon_domain(domain: str) -> str:
+    """Normalize a domain or URL (e.g. "https://www.Acme.com/about") to "acme.com"."""
+    domain = domain.strip().lower()
+    if domain.startswith(("http://", "https://")):
+        domain = urlparse(domain).netloc
+    domain = domain.split("/", 1)[0]
+    return domain[4:] if domain.startswith("www.") else domain
 
 
 class ApolloToolkit(Toolkit):
@@ -60,51 +180,213 @@ class ApolloToolkit(Toolkit):
         self.settings = get_settings()
         self.api_key = self.settings.marketing_apis.apollo_api_key
         self.base_url = "https://api.apollo.io/v1"
+        # Endpoint URLs are a plain concatenation onto this
+        self._base_url = self.base_url.rstrip("/") + "/"
         self.rate_limit = self.settings.marketing_apis.apollo_rate_limit
+        self.max_rate_limit = self.rate_limit
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
+        # Failure counts by kind ("timeout", "connection", "http_<status>", ...);
+        # read them through error_summary()
+        self.error_counts: Counter = Counter()
+        self._error_counts_lock = threading.Lock()
+
+        # Shared HTTP/2 client: concurrent calls multiplex over one connection and
+        # large JSON responses are transferred compressed. Headers are fixed per
+        # toolkit, so they are set once here rather than rebuilt on every call.
+        headers = {
+            "Accept-Encoding": "br, gzip",
+            "Cache-Control": "no-cache",
+            "Content-Type": "application/json",
+        }
+        if self.api_key:
+            headers["X-Api-Key"] = self.api_key
+        self.session = httpx.Client(
+            http2=True, headers=headers, timeout=httpx.Timeout(30.0, connect=3.0)
+        )
+
+        # Single-flight map: identical requests issued while one is already in
+        # flight wait on the same future instead of hitting the API again.
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
         if not self.api_key:
             logger.warning("Apollo API key not configured")
 
-    def _rate_limit_wait(self):
-        """Implement rate limiting between API calls."""
-        elapsed = time.time() - self.last_request_time
+    def _reserve_token(self) -> None:
+        """
+        Reserve the rate-limit slot for one logical request, sleeping until it is due.
+
+        Slots are handed out under a lock, so concurrent callers queue behind each
+        other instead of all observing the same last_request_time. Retries of the
+        same request reuse its slot and never call this again.
+        """
         min_interval = 60 / self.rate_limit  # requests per minute to seconds per request
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self.last_request_time = time.time()
+        with self._rate_limit_lock:
+            now = time.time()
+            slot = max(now, self.last_request_time + min_interval)
+            self.last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _count_error(self, kind: str) -> None:
+        """Record one request failure of the given kind."""
+        with self._error_counts_lock:
+            self.error_counts[kind] += 1
+
+    def error_summary(self) -> Dict[str, int]:
+        """
+        Return a snapshot of request failures counted so far, by kind.
+
+        Kinds are "timeout", "connection", "http_<status>" for requests that
+        finally failed, and "http_429_retried" for rate-limited attempts that
+        were retried.
+        """
+        with self._error_counts_lock:
+            return dict(self.error_counts)
+
+    def _throttled(self, response: httpx.Response, attempt: int) -> None:
+        """
+        Back off after a 429 response before retrying.
+
+        Sleeps for the server's Retry-After (or exponential backoff) plus jitter,
+        drains the limiter so the next call waits a full interval, and halves the
+        request rate (AIMD) so subsequent calls track the server's real quota.
+        """
+        wait = _retry_after_seconds(response, float(2**attempt))
+        self._count_error("http_429_retried")
+        logger.debug("Apollo API rate limited, retrying in {:.1f}s", wait)
+        time.sleep(wait + random.uniform(0, wait * 0.1))
+        with self._rate_limit_lock:
+            self.last_request_time = max(self.last_request_time, time.time())
+        self.rate_limit = max(1, self.rate_limit // 2)
+
+    @staticmethod
+    def _request_key(endpoint: str, method: str, data: Optional[Dict]) -> str:
+        """Build a stable key identifying a request by endpoint, method and payload."""
+        payload = json.dumps(data, sort_keys=True, default=str)
+        digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{method}:{endpoint}:{digest}"
 
     def _make_request(self, endpoint: str, method: str = "GET", data: Dict = None) -> Dict:
-        """Make a rate-limited request to Apollo API."""
+        """Make a rate-limited request to Apollo API, coalescing identical in-flight calls."""
         if not self.api_key:
             raise ValueError("Apollo API key not configured")
 
-        self._rate_limit_wait()
+        key = self._request_key(endpoint, method, data)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
 
-        url = f"{self.base_url}/{endpoint}"
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key,
-        }
+        if not is_leader:
+            return future.result()
 
-        start_time = time.time()
         try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=data)
-            else:
-                response = requests.post(url, headers=headers, json=data)
+            result = self._send_request(endpoint, method, data)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _send_request(
+        self, endpoint: str, method: str, data: Optional[Dict], stream: bool = False
+    ) -> Any:
+        """
+        Issue a single rate-limited HTTP request to Apollo API.
 
-            duration = time.time() - start_time
-            log_api_call("apollo", endpoint, str(response.status_code), duration)
+        With ``stream=True`` the unread response is returned so the caller can
+        parse the body incrementally; otherwise the decoded JSON is returned.
+        """
+        self._reserve_token()
+        return self._do_request_with_retries(endpoint, method, data, stream)
 
+    def _do_request_with_retries(
+        self, endpoint: str, method: str, data: Optional[Dict], stream: bool
+    ) -> Any:
+        """Fire a request whose rate-limit slot is already reserved, retrying on 429."""
+        url = self._base_url + endpoint
+
+        try:
+            for attempt in range(_MAX_RETRIES + 1):
+                start_time = time.time()
+                if method == "GET":
+                    request = self.session.build_request("GET", url, params=data)
+                else:
+                    request = self.session.build_request("POST", url, json=data)
+                response = self.session.send(request, stream=stream)
+
+                duration = time.time() - start_time
+                log_api_call("apollo", endpoint, str(response.status_code), duration)
+
+                if response.status_code != 429 or attempt == _MAX_RETRIES:
+                    break
+                response.close()
+                self._throttled(response, attempt)
+
+            if stream and response.is_error:
+                response.close()
             response.raise_for_status()
+            # Additive increase back towards the configured rate after throttling
+            if self.rate_limit < self.max_rate_limit:
+                self.rate_limit += 1
+
+            if stream:
+                return response
             return response.json()
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Apollo API request failed: {e}")
+        # Failures are counted here and logged once by the calling tool, so a
+        # throttling storm doesn't format an error line per attempt.
+        except httpx.TimeoutException:
+            self._count_error("timeout")
+            raise
+        except httpx.TransportError:
+            self._count_error("connection")
+            raise
+        except httpx.HTTPStatusError as e:
+            self._count_error(f"http_{e.response.status_code}")
             raise
 
+    def _search_people(self, data: Dict) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Run a people search, returning contacts and the pagination fields.
+
+        Large responses are stream-parsed with ijson when it is installed; small
+        ones (by Content-Length) are parsed in full.
+        """
+        if ijson is None:
+            return self._parse_people(self._make_request("mixed_people/search", "POST", data))
+
+        if not self.api_key:
+            raise ValueError("Apollo API key not configured")
+
+        response = self._send_request("mixed_people/search", "POST", data, stream=True)
+        try:
+            content_length = response.headers.get("Content-Length")
+            if content_length is not None and int(content_length) < _STREAM_MIN_BYTES:
+                response.read()
+                return self._parse_people(response.json())
+
+            pagination: Dict[str, Any] = {}
+            body = ijson.from_iter(response.iter_bytes())
+            contacts = list(_iter_streamed_people(body, pagination))
+            return contacts, pagination
+        finally:
+            response.close()
+
+    @staticmethod
+    def _parse_people(result: Dict) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Extract contacts and pagination fields from a fully parsed people search."""
+        contacts = [_parse_person(person) for person in result.get("people", [])]
+        return contacts, result
+
     @tool
     def search_people(
         self,
@@ -133,6 +415,16 @@ class ApolloToolkit(Toolkit):
         Returns:
             Dictionary containing contacts and pagination info
         """
+        if not any((query, company_names, titles, industries, locations, seniority_levels)):
+            # No filters means no meaningful search; skip the API call entirely
+            return {
+                "contacts": [],
+                "total_entries": 0,
+                "page": page,
+                "per_page": per_page,
+                "num_pages": 0,
+            }
+
         data = {"page": page, "per_page": min(per_page, 100)}  # Apollo max is 100
 
         if query:
@@ -149,35 +441,72 @@ class ApolloToolkit(Toolkit):
             data["person_seniority"] = seniority_levels
 
         try:
-            result = self._make_request("mixed_people/search", "POST", data)
-
-            contacts = []
-            for person in result.get("people", []):
-                contact = Contact(
-                    id=person.get("id"),
-                    first_name=person.get("first_name"),
-                    last_name=person.get("last_name"),
-                    name=person.get("name"),
-                    email=person.get("email"),
-                    title=person.get("title"),
-                    company_name=person.get("organization", {}).get("name"),
-                    linkedin_url=person.get("linkedin_url"),
-                    phone=person.get("phone"),
-                )
-                contacts.append(contact.to_dict())
+            contacts, pagination = self._search_people(data)
 
             return {
                 "contacts": contacts,
-                "total_entries": result.get("total_entries", 0),
-                "page": result.get("page", page),
-                "per_page": result.get("per_page", per_page),
-                "num_pages": result.get("num_pages", 0),
+                "total_entries": pagination.get("total_entries", 0),
+                "page": pagination.get("page", page),
+                "per_page": pagination.get("per_page", per_page),
+                "num_pages": pagination.get("num_pages", 0),
             }
 
         except Exception as e:
             logger.error(f"Failed to search people: {e}")
             return {"contacts": [], "error": str(e)}
 
+    def _search_organizations(
+        self,
+        query: Optional[str] = None,
+        industries: Optional[List[str]] = None,
+        locations: Optional[List[str]] = None,
+        size_ranges: Optional[List[str]] = None,
+        revenue_ranges: Optional[List[str]] = None,
+        technologies: Optional[List[str]] = None,
+        exclude_organization_ids: Optional[List[str]] = None,
+        page: int = 1,
+        per_page: int = 25,
+    ) -> Dict[str, Any]:
+        """Run an organization search, raising on request failures."""
+        if not any((query, industries, locations, size_ranges, revenue_ranges, technologies)):
+            # No filters means no meaningful search; skip the API call entirely
+            return {
+                "companies": [],
+                "total_entries": 0,
+                "page": page,
+                "per_page": per_page,
+                "num_pages": 0,
+            }
+
+        data = {"page": page, "per_page": min(per_page, 100)}
+
+        if query:
+            data["q"] = query
+        if industries:
+            data["organization_industry_tag_ids"] = industries
+        if locations:
+            data["organization_locations"] = locations
+        if size_ranges:
+            data["organization_num_employees_ranges"] = size_ranges
+        if revenue_ranges:
+            data["organization_revenue_ranges"] = revenue_ranges
+        if technologies:
+            data["technology_names"] = technologies
+        if exclude_organization_ids:
+            data["organization_not_ids"] = exclude_organization_ids
+
+        result = self._make_request("mixed_companies/search", "POST", data)
+
+        companies = [_parse_organization(org) for org in result.get("organizations", [])]
+
+        return {
+            "companies": companies,
+            "total_entries": result.get("total_entries", 0),
+            "page": result.get("page", page),
+            "per_page": result.get("per_page", per_page),
+            "num_pages": result.get("num_pages", 0),
+        }
+
     @tool
     def search_organizations(
         self,
@@ -187,6 +516,7 @@ class ApolloToolkit(Toolkit):
         size_ranges: Optional[List[str]] = None,
         revenue_ranges: Optional[List[str]] = None,
         technologies: Optional[List[str]] = None,
+        exclude_organization_ids: Optional[List[str]] = None,
         page: int = 1,
         per_page: int = 25,
     ) -> Dict[str, Any]:
@@ -200,59 +530,25 @@ class ApolloToolkit(Toolkit):
             size_ranges: List of company size ranges (e.g., "1-10", "11-50")
             revenue_ranges: List of revenue ranges
             technologies: List of technologies used by the company
+            exclude_organization_ids: Apollo organization IDs to leave out of the results
             page: Page number for pagination
             per_page: Number of results per page
 
         Returns:
             Dictionary containing companies and pagination info
         """
-        data = {"page": page, "per_page": min(per_page, 100)}
-
-        if query:
-            data["q"] = query
-        if industries:
-            data["organization_industry_tag_ids"] = industries
-        if locations:
-            data["organization_locations"] = locations
-        if size_ranges:
-            data["organization_num_employees_ranges"] = size_ranges
-        if revenue_ranges:
-            data["organization_revenue_ranges"] = revenue_ranges
-        if technologies:
-            data["technology_names"] = technologies
-
         try:
-            result = self._make_request("mixed_companies/search", "POST", data)
-
-            companies = []
-            for org in result.get("organizations", []):
-                company = Company(
-                    id=org.get("id"),
-                    name=org.get("name"),
-                    domain=org.get("primary_domain"),
-                    industry=(
-                        org.get("primary_industry", {}).get("industry")
-                        if org.get("primary_industry")
-                        else None
-                    ),
-                    size=org.get("employee_count"),
-                    location=(
-                        org.get("primary_phone", {}).get("source")
-                        if org.get("primary_phone")
-                        else None
-                    ),
-                    revenue=org.get("estimated_num_employees"),
-                    technologies=[tech.get("name") for tech in org.get("technologies", [])],
-                )
-                companies.append(company.to_dict())
-
-            return {
-                "companies": companies,
-                "total_entries": result.get("total_entries", 0),
-                "page": result.get("page", page),
-                "per_page": result.get("per_page", per_page),
-                "num_pages": result.get("num_pages", 0),
-            }
+            return self._search_organizations(
+                query=query,
+                industries=industries,
+                locations=locations,
+                size_ranges=size_ranges,
+                revenue_ranges=revenue_ranges,
+                technologies=technologies,
+                exclude_organization_ids=exclude_organization_ids,
+                page=page,
+                per_page=per_page,
+            )
 
         except Exception as e:
             logger.error(f"Failed to search organizations: {e}")
@@ -269,25 +565,13 @@ class ApolloToolkit(Toolkit):
         Returns:
             Dictionary containing enriched contact information
         """
-        data = {"email": email}
+        data = {"email": _canon_email(email)}
 
         try:
             result = self._make_request("people/match", "POST", data)
 
             if result.get("person"):
-                person = result["person"]
-                contact = Contact(
-                    id=person.get("id"),
-                    first_name=person.get("first_name"),
-                    last_name=person.get("last_name"),
-                    name=person.get("name"),
-                    email=person.get("email"),
-                    title=person.get("title"),
-                    company_name=person.get("organization", {}).get("name"),
-                    linkedin_url=person.get("linkedin_url"),
-                    phone=person.get("phone"),
-                )
-                return {"contact": contact.to_dict(), "enriched": True}
+                return {"contact": _parse_person(result["person"]), "enriched": True}
             else:
                 return {"contact": None, "enriched": False, "message": "Contact not found"}
 
@@ -295,6 +579,13 @@ class ApolloToolkit(Toolkit):
             logger.error(f"Failed to enrich contact: {e}")
             return {"contact": None, "enriched": False, "error": str(e)}
 
+    def _enrich_company(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Look up a company by domain; return its record, or None if Apollo has no match."""
+        data = {"domain": _canon_domain(domain)}
+        result = self._make_request("organizations/enrich", "POST", data)
+        organization = result.get("organization")
+        return _parse_organization(organization) if organization else None
+
     @tool
     def enrich_company(self, domain: str) -> Dict[str, Any]:
         """
@@ -306,32 +597,11 @@ class ApolloToolkit(Toolkit):
         Returns:
             Dictionary containing enriched company information
         """
-        data = {"domain": domain}
-
         try:
-            result = self._make_request("organizations/enrich", "POST", data)
-
-            if result.get("organization"):
-                org = result["organization"]
-                company = Company(
-                    id=org.get("id"),
-                    name=org.get("name"),
-                    domain=org.get("primary_domain"),
-                    industry=(
-                        org.get("primary_industry", {}).get("industry")
-                        if org.get("primary_industry")
-                        else None
-                    ),
-                    size=org.get("employee_count"),
-                    location=(
-                        org.get("primary_phone", {}).get("source")
-                        if org.get("primary_phone")
-                        else None
-                    ),
-                    revenue=org.get("estimated_num_employees"),
-                    technologies=[tech.get("name") for tech in org.get("technologies", [])],
-                )
-                return {"company": company.to_dict(), "enriched": True}
+            company = self._enrich_company(domain)
+
+            if company:
+                return {"company": company, "enriched": True}
             else:
                 return {"company": None, "enriched": False, "message": "Company not found"}
 
@@ -339,6 +609,77 @@ class ApolloToolkit(Toolkit):
             logger.error(f"Failed to enrich company: {e}")
             return {"company": None, "enriched": False, "error": str(e)}
 
+    @tool
+    def bulk_enrich_contacts(self, emails: List[str]) -> Dict[str, Any]:
+        """
+        Enrich several contacts at once using Apollo's bulk match API.
+
+        Emails are de-duplicated after normalization and sent in batches of 10,
+        so N emails cost ceil(N / 10) API calls instead of N.
+
+        Args:
+            emails: Email addresses to enrich
+
+        Returns:
+            Dictionary containing the enriched contacts
+        """
+        unique_emails = list(dict.fromkeys(_canon_email(email) for email in emails))
+
+        try:
+            contacts = []
+            for i in range(0, len(unique_emails), _BULK_BATCH_SIZE):
+                batch = unique_emails[i : i + _BULK_BATCH_SIZE]
+                data = {"details": [{"email": email} for email in batch]}
+                result = self._make_request("people/bulk_match", "POST", data)
+                contacts.extend(
+                    _parse_person(person) for person in result.get("matches", []) if person
+                )
+
+            return {
+                "contacts": contacts,
+                "requested": len(unique_emails),
+                "total_found": len(contacts),
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to bulk enrich contacts: {e}")
+            return {"contacts": [], "requested": len(unique_emails), "error": str(e)}
+
+    @tool
+    def bulk_enrich_companies(self, domains: List[str]) -> Dict[str, Any]:
+        """
+        Enrich several companies at once using Apollo's bulk enrichment API.
+
+        Domains are de-duplicated after normalization and sent in batches of 10,
+        so N domains cost ceil(N / 10) API calls instead of N.
+
+        Args:
+            domains: Company domains to enrich
+
+        Returns:
+            Dictionary containing the enriched companies
+        """
+        unique_domains = list(dict.fromkeys(_canon_domain(domain) for domain in domains))
+
+        try:
+            companies = []
+            for i in range(0, len(unique_domains), _BULK_BATCH_SIZE):
+                batch = unique_domains[i : i + _BULK_BATCH_SIZE]
+                result = self._make_request("organizations/bulk_enrich", "POST", {"domains": batch})
+                companies.extend(
+                    _parse_organization(org) for org in result.get("organizations", []) if org
+                )
+
+            return {
+                "companies": companies,
+                "requested": len(unique_domains),
+                "total_found": len(companies),
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to bulk enrich companies: {e}")
+            return {"companies": [], "requested": len(unique_domains), "error": str(e)}
+
     @tool
     def get_contact_details(self, contact_id: str) -> Dict[str, Any]:
         """
@@ -354,19 +695,7 @@ class ApolloToolkit(Toolkit):
             result = self._make_request(f"people/{contact_id}")
 
             if result.get("person"):
-                person = result["person"]
-                contact = Contact(
-                    id=person.get("id"),
-                    first_name=person.get("first_name"),
-                    last_name=person.get("last_name"),
-                    name=person.get("name"),
-                    email=person.get("email"),
-                    title=person.get("title"),
-                    company_name=person.get("organization", {}).get("name"),
-                    linkedin_url=person.get("linkedin_url"),
-                    phone=person.get("phone"),
-                )
-                return {"contact": contact.to_dict(), "found": True}
+                return {"contact": _parse_person(result["person"]), "found": True}
             else:
                 return {"contact": None, "found": False, "message": "Contact not found"}
 
@@ -386,13 +715,17 @@ class ApolloToolkit(Toolkit):
         Returns:
             Dictionary containing similar companies
         """
+        company_domain = _canon_domain(company_domain)
+
         try:
             # First get the company details
-            company_data = self.enrich_company(company_domain)
-            if not company_data.get("enriched"):
+            ref_company = self._enrich_company(company_domain)
+            if ref_company is None:
                 return {"companies": [], "error": "Reference company not found"}
 
-            ref_company = company_data["company"]
+            if not any(ref_company.get(key) for key in ("industry", "size", "technologies")):
+                # Nothing discriminative to search on, so any search would be unfiltered
+                return {"companies": [], "reference_company": ref_company, "total_found": 0}
 
             # Search for companies with similar characteristics
             search_params = {"per_page": limit}
@@ -404,17 +737,32 @@ class ApolloToolkit(Toolkit):
             if ref_company.get("technologies"):
                 search_params["technologies"] = ref_company["technologies"][:3]  # Limit to first 3
 
-            result = self.search_organizations(**search_params)
-
-            # Filter out the reference company
+            # Ask Apollo to exclude the reference company, and over-fetch by one so a
+            # result slot is left over if the exclusion is ignored
+            search_params["per_page"] = limit + 1
+            ref_id = ref_company.get("id")
+            if ref_id:
+                search_params["exclude_organization_ids"] = [ref_id]
+
+            try:
+                result = self._search_organizations(**search_params)
+            except httpx.HTTPStatusError as e:
+                if not ref_id or e.response.status_code not in _REJECTED_PARAM_STATUSES:
+                    raise
+                # Exclusion rejected: search without it and rely on the local filter
+                del search_params["exclude_organization_ids"]
+                result = self._search_organizations(**search_params)
+
+            # Drop the reference company whichever way the search ran
             similar_companies = [
                 company
-                for company in result.get("companies", [])
-                if company.get("domain") != company_domain
-            ]
+                for company in result["companies"]
+                if not (ref_id and company.get("id") == ref_id)
+                and _canon_domain(company.get("domain") or "") != company_domain
+            ][:limit]
 
             return {
-                "companies": similar_companies[:limit],
+                "companies": similar_companies,
                 "reference_company": ref_company,
                 "total_found": len(similar_companies),
             }
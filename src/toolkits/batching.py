@@ -0,0 +1,96 @@
+"""
+Request batching helpers shared by the API toolkits.
+
+Provides an asyncio micro-batcher that coalesces calls arriving close together
+into a single batch call, so concurrent single-record writes can share one
+round trip and one rate-limit token.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+
+class RequestBatcher:
+    """
+    Coalesce concurrent async submissions into batch calls.
+
+    Items submitted within ``window`` seconds of the first pending item are
+    handed to ``flush`` together, up to ``max_size`` at a time. ``flush`` must
+    return one result per item, in order; each submitter receives the result
+    for its own item, or the exception if the whole flush failed. Items left
+    without a result because ``flush`` returned too few fail with RuntimeError.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Any]], Awaitable[List[Any]]],
+        window: float = 0.05,
+        max_size: int = 100,
+    ):
+        self._flush = flush
+        self.window = window
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item for the next batch and wait for its result."""
+        # The worker belongs to the loop that started it; start a fresh one once
+        # that loop has gone (e.g. across separate asyncio.run calls)
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background worker."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for one item, then gather whatever else arrives within the window."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.window
+
+        while len(batch) < self.max_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            try:
+                results = await self._flush([item for item, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+                # Never leave a submitter waiting on an item flush didn't answer
+                unanswered = batch[len(results) :]
+                if unanswered:
+                    error = RuntimeError(
+                        f"Batch flush returned {len(results)} results for {len(batch)} items"
+                    )
+                    for _, future in unanswered:
+                        if not future.done():
+                            future.set_exception(error)
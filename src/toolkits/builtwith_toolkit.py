@@ -5,20 +5,79 @@ Provides technology stack analysis, competitor research, and technical profiling
 capabilities through the BuiltWith API.
 """
 
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlparse
 
 import requests
 from agno.tools import Toolkit, tool
+from cachetools import TTLCache
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 from config.logging import log_api_call
 from config.settings import get_settings
 
+from .rate_limit import TokenBucket
 
-@dataclass
-class Technology:
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as json_loads
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; fall back to decoding into plain dicts
+    msgspec = None
+
+T = TypeVar("T")
+
+# BuiltWith data changes slowly, so responses are cached on disk. Technology
+# profiles keep for a day; trend and market share data for an hour.
+_CACHE_NAME = ".cache/builtwith"
+_CACHE_EXPIRE_AFTER = timedelta(hours=24)
+_CACHE_URLS_EXPIRE_AFTER = {
+    "api.builtwith.com/v20": timedelta(hours=24),
+    "api.builtwith.com/trends1": timedelta(hours=1),
+    "api.builtwith.com/market1": timedelta(hours=1),
+}
+
+# Maximum number of BuiltWith requests in flight at once during concurrent fan-outs
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Domains looked up per v20 request; BuiltWith accepts a comma-separated LOOKUP
+_LOOKUP_BATCH_SIZE = 16
+
+# Parsed domain profiles kept in memory, in front of the on-disk response cache.
+# They expire with the v20 responses they were parsed from.
+_PROFILE_CACHE_SIZE = 256
+_PROFILE_CACHE_TTL = _CACHE_URLS_EXPIRE_AFTER["api.builtwith.com/v20"].total_seconds()
+
+# Categories whose technologies are used to discover a domain's competitors
+_KEY_CATEGORIES = frozenset({"Analytics", "CMS", "E-commerce", "Marketing"})
+
+
+class Technology(NamedTuple):
     """Technology information from BuiltWith."""
 
     name: str
@@ -28,11 +87,10 @@ class Technology:
     last_detected: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k in _TECHNOLOGY_FIELDS if (v := getattr(self, k)) is not None}
 
 
-@dataclass
-class TechProfile:
+class TechProfile(NamedTuple):
     """Complete technology profile for a domain."""
 
     domain: str
@@ -42,13 +100,133 @@ class TechProfile:
     profile_date: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "domain": self.domain,
-            "technologies": [tech.to_dict() for tech in self.technologies],
-            "categories": self.categories,
-            "total_technologies": self.total_technologies,
-            "profile_date": self.profile_date,
-        }
+        profile = dict(zip(_TECH_PROFILE_FIELDS, self))
+        profile["technologies"] = [tech.to_dict() for tech in self.technologies]
+        return profile
+
+
+# Field names of the profile types, resolved once for their to_dict methods
+_TECHNOLOGY_FIELDS = Technology._fields
+_TECH_PROFILE_FIELDS = TechProfile._fields
+
+
+if msgspec is not None:
+    # Typed schema for the parts of a v20 domain lookup that profiles use. Decoding
+    # straight into these skips building the intermediate dicts, and unknown keys
+    # are ignored by the decoder instead of being materialised.
+
+    class _LookupTech(msgspec.Struct):
+        Name: Optional[str] = "Unknown"
+        FirstDetected: Any = None
+        LastDetected: Any = None
+
+    class _LookupGroup(msgspec.Struct):
+        Name: Optional[str] = "Unknown"
+        Categories: Optional[List[_LookupTech]] = None
+
+    class _LookupPath(msgspec.Struct):
+        Technologies: Optional[List[_LookupGroup]] = None
+
+    class _LookupResult(msgspec.Struct):
+        Paths: Optional[List[_LookupPath]] = None
+
+    class _LookupItem(msgspec.Struct):
+        Lookup: Optional[str] = None
+        Result: Optional[_LookupResult] = None
+        FirstIndexed: Any = None
+
+    class _LookupResponse(msgspec.Struct):
+        Results: Optional[List[_LookupItem]] = None
+
+    _LOOKUP_DECODER = msgspec.json.Decoder(_LookupResponse)
+else:
+    _LOOKUP_DECODER = None
+
+
+def _canon_domain(domain: str) -> str:
+    """Normalize a domain or URL (e.g. "https://www.Acme.com/about") to "acme.com"."""
+    domain = domain.strip().lower()
+    if domain.startswith(("http://", "https://")):
+        domain = urlparse(domain).netloc
+    domain = domain.split("/", 1)[0]
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+def _error_profile(domain: str, error: str) -> Dict[str, Any]:
+    """Empty technology profile for a domain that could not be profiled."""
+    return {
+        "domain": domain,
+        "technologies": [],
+        "categories": {},
+        "total_technologies": 0,
+        "error": error,
+    }
+
+
+# A technology group as (category name, [(name, first detected, last detected), ...])
+_TechGroup = Tuple[str, List[Tuple[str, Any, Any]]]
+
+
+def _dict_lookup_item(item: Dict[str, Any]) -> Tuple[Iterator[_TechGroup], Any]:
+    """Normalize one ``Results`` entry decoded into plain dicts for ``_build_profile``."""
+    groups = (
+        (
+            tech_category.get("Name", "Unknown"),
+            [
+                (tech.get("Name", "Unknown"), tech.get("FirstDetected"), tech.get("LastDetected"))
+                for tech in tech_category.get("Categories", ()) or ()
+            ],
+        )
+        for result_item in (item.get("Result") or {}).get("Paths", ()) or ()
+        for tech_category in result_item.get("Technologies", ()) or ()
+    )
+    return groups, item.get("FirstIndexed")
+
+
+def _struct_lookup_item(item: "_LookupItem") -> Tuple[Iterator[_TechGroup], Any]:
+    """Normalize one ``Results`` entry decoded by msgspec for ``_build_profile``."""
+    paths = item.Result.Paths if item.Result else None
+    groups = (
+        (
+            tech_category.Name,
+            [
+                (tech.Name, tech.FirstDetected, tech.LastDetected)
+                for tech in tech_category.Categories or ()
+            ],
+        )
+        for result_item in paths or ()
+        for tech_category in result_item.Technologies or ()
+    )
+    return groups, item.FirstIndexed
+
+
+def _build_profile(
+    domain: str, tech_groups: Iterable[_TechGroup], profile_date: Any
+) -> Dict[str, Any]:
+    """Build a technology profile dict from a domain's normalized technology groups."""
+    technologies = []
+    append = technologies.append
+    categories = defaultdict(int)
+
+    # Each group is counted once, so groups without technologies still show up
+    # with a count of zero; absent dates are left out of the entries
+    for category_name, techs in tech_groups:
+        categories[category_name] += len(techs)
+        for name, first_detected, last_detected in techs:
+            entry = {"name": name, "category": category_name}
+            if first_detected is not None:
+                entry["first_detected"] = first_detected
+            if last_detected is not None:
+                entry["last_detected"] = last_detected
+            append(entry)
+
+    return {
+        "domain": domain,
+        "technologies": technologies,
+        "categories": dict(categories),
+        "total_technologies": len(technologies),
+        "profile_date": profile_date,
+    }
 
 
 class BuiltWithToolkit(Toolkit):
@@ -59,44 +237,229 @@ class BuiltWithToolkit(Toolkit):
         self.settings = get_settings()
         self.api_key = self.settings.marketing_apis.builtwith_api_key
         self.base_url = "https://api.builtwith.com"
-        self.last_request_time = 0
+        self.rate_limit = self.settings.marketing_apis.builtwith_rate_limit
+        # Per-call API logging is only worth its cost when debugging
+        self._log_api_calls = self.settings.debug
+        # Token bucket shared by the sync and async paths: fan-outs can burst up to
+        # the per-minute allowance, then settle to the steady rate.
+        self._limiter = TokenBucket.per_minute(self.rate_limit)
+
+        # Persistent session: keep-alive connections skip a TLS handshake per call,
+        # transient 429/5xx responses are retried with backoff by urllib3, and
+        # repeat lookups are answered from a local SQLite cache.
+        self.session = CachedSession(
+            cache_name=_CACHE_NAME,
+            backend="sqlite",
+            expire_after=_CACHE_EXPIRE_AFTER,
+            urls_expire_after=_CACHE_URLS_EXPIRE_AFTER,
+            allowable_methods=("GET",),
+            ignored_parameters=("KEY",),
+            match_headers=False,
+        )
+        retries = Retry(
+            total=5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=0.5,
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        self.session.mount("https://", adapter)
+        # Sent with every request; requests merges it into each call's own params
+        self.session.params = {"KEY": self.api_key}
+
+        # Parsed profiles by canonical domain, guarded by a lock for the thread-pool
+        # fan-outs. Cached profiles are handed out as-is and must be treated as
+        # read-only.
+        self._profiles: TTLCache = TTLCache(maxsize=_PROFILE_CACHE_SIZE, ttl=_PROFILE_CACHE_TTL)
+        self._profiles_lock = threading.Lock()
 
         if not self.api_key:
             logger.warning("BuiltWith API key not configured")
 
-    def _rate_limit_wait(self):
-        """Implement rate limiting between API calls."""
-        elapsed = time.time() - self.last_request_time
-        min_interval = 1.0  # 1 second between requests
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self.last_request_time = time.time()
+    def _update_rate_limit(self, response_headers: Mapping[str, str]) -> None:
+        """Tighten the limiter when BuiltWith reports the quota is nearly used up."""
+        remaining = response_headers.get("X-Rate-Limit-Remaining")
+        if remaining is None or not remaining.isdigit():
+            return
+
+        remaining = int(remaining)
+        if remaining > 1:
+            return
+
+        try:
+            reset_after = float(response_headers.get("X-Rate-Limit-Reset", 0))
+        except ValueError:
+            reset_after = 0.0
+        if reset_after > time.time():  # an epoch timestamp rather than a delay
+            reset_after -= time.time()
+        self._limiter.throttle(remaining, reset_after)
+
+    def _make_request(
+        self,
+        endpoint: str,
+        params: Dict = None,
+        decode: Callable[[bytes], Any] = json_loads,
+    ) -> Any:
+        """
+        Make a rate-limited request to BuiltWith API.
 
-    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """Make a rate-limited request to BuiltWith API."""
+        Returns the body as decoded by ``decode`` (JSON by default).
+        """
         if not self.api_key:
             raise ValueError("BuiltWith API key not configured")
 
-        self._rate_limit_wait()
-
         url = f"{self.base_url}/{endpoint}"
-        default_params = {"KEY": self.api_key}
-        if params:
-            default_params.update(params)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = requests.get(url, params=default_params)
-            duration = time.time() - start_time
-            log_api_call("builtwith", endpoint, str(response.status_code), duration)
+            # Cache hits are served locally and don't spend a rate-limit token
+            response = self.session.get(url, params=params, only_if_cached=True)
+            if response.status_code == 504:  # not cached (or expired)
+                self._limiter.acquire()
+                start_time = time.perf_counter()
+                response = self.session.get(url, params=params, timeout=(3.05, 30))
+
+            if self._log_api_calls:
+                duration = time.perf_counter() - start_time
+                log_api_call("builtwith", endpoint, str(response.status_code), duration)
+            self._update_rate_limit(response.headers)
 
             response.raise_for_status()
-            return response.json()
+            return decode(response.content)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"BuiltWith API request failed: {e}")
             raise
 
+    def _cached_profile(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Return the in-memory profile for a domain, if there is one."""
+        with self._profiles_lock:
+            return self._profiles.get(domain)
+
+    def _remember_profile(self, domain: str, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successfully fetched profile and return it."""
+        if not profile.get("error"):
+            with self._profiles_lock:
+                self._profiles[domain] = profile
+        return profile
+
+    def _decode_profiles(self, domains: List[str], content: bytes) -> Dict[str, Dict[str, Any]]:
+        """
+        Decode a buffered v20 lookup of one or more domains into profiles by domain.
+
+        ``domains`` must already be canonical (see ``_canon_domain``). Results are
+        matched to them on their canonicalized ``Lookup`` field; domains BuiltWith
+        returned nothing for get a "No data found" profile.
+        """
+        if _LOOKUP_DECODER is None:
+            results = json_loads(content).get("Results") or ()
+            by_lookup = {_canon_domain(item.get("Lookup") or ""): item for item in results}
+            normalize = _dict_lookup_item
+        else:
+            results = _LOOKUP_DECODER.decode(content).Results or ()
+            by_lookup = {_canon_domain(item.Lookup or ""): item for item in results}
+            normalize = _struct_lookup_item
+
+        # A single-domain lookup needs no matching, whatever BuiltWith echoes back
+        if len(domains) == 1 and len(results) == 1:
+            by_lookup = {domains[0]: results[0]}
+
+        profiles = {}
+        for domain in domains:
+            domain_data = by_lookup.get(domain)
+            if domain_data is None:
+                profiles[domain] = _error_profile(domain, "No data found for domain")
+            else:
+                profiles[domain] = _build_profile(domain, *normalize(domain_data))
+        return profiles
+
+    def _fetch_domains(self, domains: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch technology profiles for several domains, keyed by canonical domain.
+
+        Domains are canonicalized first, so URL and case variants share one
+        lookup. Those not already cached are looked up in batches of up to
+        ``_LOOKUP_BATCH_SIZE`` per request, so each batch costs a single
+        round trip and rate-limit token. Failures are reported per domain.
+        """
+        profiles = {}
+        missing = []
+        for domain in dict.fromkeys(map(_canon_domain, domains)):
+            cached = self._cached_profile(domain)
+            if cached is None:
+                missing.append(domain)
+            else:
+                profiles[domain] = cached
+
+        for i in range(0, len(missing), _LOOKUP_BATCH_SIZE):
+            batch = missing[i : i + _LOOKUP_BATCH_SIZE]
+            try:
+                fetched = self._make_request(
+                    "v20/api.json",
+                    {"LOOKUP": ",".join(batch)},
+                    decode=partial(self._decode_profiles, batch),
+                )
+            except Exception as e:
+                logger.error(f"Failed to get domain technologies: {e}")
+                fetched = {domain: _error_profile(domain, str(e)) for domain in batch}
+
+            for domain, profile in fetched.items():
+                profiles[domain] = self._remember_profile(domain, profile)
+
+        return profiles
+
+    def _build_company_list(
+        self, technology: str, country: Optional[str], limit: int, result: Dict
+    ) -> Dict[str, Any]:
+        """Turn a v20 technology search response into a list of companies."""
+        companies = []
+        if result.get("Results"):
+            for company in result["Results"][:limit]:
+                company_info = {
+                    "domain": company.get("Domain"),
+                    "country": company.get("Country"),
+                    "first_detected": company.get("FirstIndexed"),
+                    "last_detected": company.get("LastIndexed"),
+                    "vertical": company.get("Vertical"),
+                }
+                companies.append(company_info)
+
+        return {
+            "technology": technology,
+            "companies": companies,
+            "total_found": len(companies),
+            "country_filter": country,
+        }
+
+    def _fan_out(self, func: Callable[[str], T], items: List[str]) -> List[T]:
+        """
+        Call ``func`` on each item concurrently, returning the results in order.
+
+        The calls run on a small thread pool over the shared session, so they
+        keep its response cache, retries and keep-alive connections.
+        """
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(func, items))
+
+    def _find_companies(self, technology: str, country: Optional[str], limit: int) -> Dict:
+        """Search for companies using a technology, returning an error dict on failure."""
+        params = {"TECH": technology, "SINCE": ""}
+        if country:
+            params["COUNTRY"] = country
+
+        try:
+            result = self._make_request("v20/api.json", params)
+            return self._build_company_list(technology, country, limit, result)
+
+        except Exception as e:
+            logger.error(f"Failed to find companies using technology: {e}")
+            return {"technology": technology, "companies": [], "total_found": 0, "error": str(e)}
+
+    def _fetch_profile(self, domain: str) -> Dict[str, Any]:
+        """Fetch a domain's technology profile, returning an error dict on failure."""
+        domain = _canon_domain(domain)
+        return self._fetch_domains([domain])[domain]
+
     @tool
     def get_domain_technologies(self, domain: str) -> Dict[str, Any]:
         """
@@ -108,59 +471,7 @@ class BuiltWithToolkit(Toolkit):
         Returns:
             Dictionary containing technology stack information
         """
-        try:
-            result = self._make_request("v20/api.json", {"LOOKUP": domain})
-
-            if not result.get("Results"):
-                return {
-                    "domain": domain,
-                    "technologies": [],
-                    "categories": {},
-                    "total_technologies": 0,
-                    "error": "No data found for domain",
-                }
-
-            domain_data = result["Results"][0]
-            technologies = []
-            categories = {}
-
-            # Process all technology categories
-            for result_item in domain_data.get("Result", {}).get("Paths", []):
-                for tech_category in result_item.get("Technologies", []):
-                    category_name = tech_category.get("Name", "Unknown")
-                    categories[category_name] = categories.get(category_name, 0)
-
-                    for tech in tech_category.get("Categories", []):
-                        tech_name = tech.get("Name", "Unknown")
-
-                        technology = Technology(
-                            name=tech_name,
-                            category=category_name,
-                            first_detected=tech.get("FirstDetected"),
-                            last_detected=tech.get("LastDetected"),
-                        )
-                        technologies.append(technology)
-                        categories[category_name] += 1
-
-            profile = TechProfile(
-                domain=domain,
-                technologies=technologies,
-                categories=categories,
-                total_technologies=len(technologies),
-                profile_date=domain_data.get("FirstIndexed"),
-            )
-
-            return profile.to_dict()
-
-        except Exception as e:
-            logger.error(f"Failed to get domain technologies: {e}")
-            return {
-                "domain": domain,
-                "technologies": [],
-                "categories": {},
-                "total_technologies": 0,
-                "error": str(e),
-            }
+        return self._fetch_profile(domain)
 
     @tool
     def find_companies_using_technology(
@@ -177,35 +488,7 @@ class BuiltWithToolkit(Toolkit):
         Returns:
             Dictionary containing companies using the technology
         """
-        params = {"TECH": technology, "SINCE": ""}
-        if country:
-            params["COUNTRY"] = country
-
-        try:
-            result = self._make_request("v20/api.json", params)
-
-            companies = []
-            if result.get("Results"):
-                for company in result["Results"][:limit]:
-                    company_info = {
-                        "domain": company.get("Domain"),
-                        "country": company.get("Country"),
-                        "first_detected": company.get("FirstIndexed"),
-                        "last_detected": company.get("LastIndexed"),
-                        "vertical": company.get("Vertical"),
-                    }
-                    companies.append(company_info)
-
-            return {
-                "technology": technology,
-                "companies": companies,
-                "total_found": len(companies),
-                "country_filter": country,
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to find companies using technology: {e}")
-            return {"technology": technology, "companies": [], "total_found": 0, "error": str(e)}
+        return self._find_companies(technology, country, limit)
 
     @tool
     def get_technology_trends(self, technology: str, months: int = 12) -> Dict[str, Any]:
@@ -258,48 +541,45 @@ class BuiltWithToolkit(Toolkit):
         Returns:
             Dictionary containing comparison analysis
         """
-        if len(domains) > 10:
-            domains = domains[:10]  # Limit to prevent excessive API calls
+        # Drop repeated domains (keeping order), then limit to prevent excessive API calls
+        domains = list(dict.fromkeys(filter(None, map(_canon_domain, domains))))[:10]
 
         try:
             profiles = {}
-            all_technologies = set()
 
-            for domain in domains:
-                profile = self.get_domain_technologies(domain)
+            # Look all domains up together rather than one rate-limited call at a time
+            for domain, profile in self._fetch_domains(domains).items():
                 if not profile.get("error"):
                     profiles[domain] = profile
-                    for tech in profile["technologies"]:
-                        all_technologies.add(tech["name"])
+
+            # One hashed set per domain turns every membership test below into an O(1)
+            # lookup instead of a scan over the domain's technology list
+            tech_sets = {
+                domain: frozenset(tech["name"] for tech in profile["technologies"])
+                for domain, profile in profiles.items()
+            }
+            domain_counts = Counter(chain.from_iterable(tech_sets.values()))
 
             # Create comparison matrix
             comparison = {
                 "domains": list(profiles.keys()),
-                "technology_matrix": {},
-                "common_technologies": [],
+                "technology_matrix": {
+                    tech: {domain: tech in tech_set for domain, tech_set in tech_sets.items()}
+                    for tech in domain_counts
+                },
+                "common_technologies": [
+                    tech for tech, count in domain_counts.items() if count == len(profiles)
+                ],
                 "unique_technologies": {},
                 "category_comparison": {},
             }
 
-            # Build technology matrix
-            for tech in all_technologies:
-                comparison["technology_matrix"][tech] = {}
-                domains_with_tech = []
-
-                for domain, profile in profiles.items():
-                    has_tech = any(t["name"] == tech for t in profile["technologies"])
-                    comparison["technology_matrix"][tech][domain] = has_tech
-                    if has_tech:
-                        domains_with_tech.append(domain)
-
-                # Track common technologies
-                if len(domains_with_tech) == len(profiles):
-                    comparison["common_technologies"].append(tech)
-                elif len(domains_with_tech) == 1:
-                    domain = domains_with_tech[0]
-                    if domain not in comparison["unique_technologies"]:
-                        comparison["unique_technologies"][domain] = []
-                    comparison["unique_technologies"][domain].append(tech)
+            # Technologies found on exactly one of several domains
+            if len(profiles) > 1:
+                for domain, tech_set in tech_sets.items():
+                    unique = [tech for tech in tech_set if domain_counts[tech] == 1]
+                    if unique:
+                        comparison["unique_technologies"][domain] = unique
 
             # Category comparison
             for domain, profile in profiles.items():
@@ -365,28 +645,35 @@ class BuiltWithToolkit(Toolkit):
         Returns:
             Dictionary containing competitor technology analysis
         """
+        reference_domain = _canon_domain(reference_domain)
+
         try:
             # Get reference domain's technology stack
-            ref_profile = self.get_domain_technologies(reference_domain)
+            ref_profile = self._fetch_profile(reference_domain)
             if ref_profile.get("error"):
                 return {"error": f"Could not analyze reference domain: {ref_profile['error']}"}
+            ref_tech_set = frozenset(tech["name"] for tech in ref_profile["technologies"])
 
             # Find key technologies from reference domain
             key_technologies = [
                 tech["name"]
                 for tech in ref_profile["technologies"]
-                if tech.get("category") in ["Analytics", "CMS", "E-commerce", "Marketing"]
+                if tech.get("category") in _KEY_CATEGORIES
             ][
                 :3
             ]  # Focus on top 3 key technologies
 
             competitors = {}
 
-            # Find companies using similar technologies
-            for tech in key_technologies:
-                tech_companies = self.find_companies_using_technology(tech, limit=limit * 2)
+            # Find companies using similar technologies, searching all of them concurrently
+            tech_searches = self._fan_out(
+                lambda tech: self._find_companies(tech, None, limit * 2), key_technologies
+            )
+            for tech, tech_companies in zip(key_technologies, tech_searches):
                 for company in tech_companies.get("companies", []):
-                    domain = company["domain"]
+                    domain = _canon_domain(company["domain"] or "")
+                    if not domain:
+                        continue
                     if domain != reference_domain and domain not in competitors:
                         competitors[domain] = {"shared_technologies": [tech], "profile": None}
                     elif domain in competitors:
@@ -397,17 +684,23 @@ class BuiltWithToolkit(Toolkit):
                 competitors.items(), key=lambda x: len(x[1]["shared_technologies"]), reverse=True
             )[:limit]
 
+            # Profile the competitors in one batched lookup rather than one at a time
+            competitor_profiles = self._fetch_domains([domain for domain, _ in top_competitors])
+
             competitor_analysis = []
-            for domain, data in top_competitors:
-                profile = self.get_domain_technologies(domain)
+            for domain, _ in top_competitors:
+                profile = competitor_profiles[domain]
                 if not profile.get("error"):
+                    # Exact overlap with the reference stack, not just the seed technologies
+                    shared = ref_tech_set.intersection(
+                        tech["name"] for tech in profile["technologies"]
+                    )
                     competitor_analysis.append(
                         {
                             "domain": domain,
-                            "shared_technologies": data["shared_technologies"],
+                            "shared_technologies": sorted(shared),
                             "total_technologies": profile["total_technologies"],
                             "technology_categories": profile["categories"],
-                            "technologies": profile["technologies"],
                         }
                     )
 
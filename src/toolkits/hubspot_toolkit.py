@@ -5,20 +5,73 @@ Provides comprehensive CRM operations, contact management, deal tracking,
 and marketing automation capabilities through the HubSpot API.
 """
 
+import asyncio
+import json
+import random
+import sys
+import threading
 import time
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
-
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import aiohttp
 import requests
 from agno.tools import Toolkit, tool
+from cachetools import TTLCache
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config.logging import log_api_call
 from config.settings import get_settings
 
+from .batching import RequestBatcher
+from .rate_limit import TokenBucket
+
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib serializer and parser
+    from json import dumps as json_dumps
+    from json import loads as json_loads
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to parsing whole search pages
+    ijson = None
+
+# Slotted records skip the per-instance __dict__; dataclass only supports this from 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
-class HubSpotContact:
+class _Record:
+    """Shared ``to_dict`` for the HubSpot record types."""
+
+    __slots__ = ()
+
+    # Names of the record's fields other than ``properties``, set per record type
+    _FIELDS: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        base_dict = {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
+        base_dict.update(self.properties)
+        return base_dict
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class HubSpotContact(_Record):
     """HubSpot contact data structure."""
 
     id: Optional[str] = None
@@ -33,14 +86,9 @@ class HubSpotContact:
     lead_status: Optional[str] = None
     properties: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
-        base_dict = {k: v for k, v in self.__dict__.items() if v is not None and k != "properties"}
-        base_dict.update(self.properties)
-        return base_dict
-
 
-@dataclass
-class HubSpotDeal:
+@dataclass(**_DATACLASS_OPTIONS)
+class HubSpotDeal(_Record):
     """HubSpot deal data structure."""
 
     id: Optional[str] = None
@@ -52,14 +100,9 @@ class HubSpotDeal:
     hubspot_owner_id: Optional[str] = None
     properties: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
-        base_dict = {k: v for k, v in self.__dict__.items() if v is not None and k != "properties"}
-        base_dict.update(self.properties)
-        return base_dict
 
-
-@dataclass
-class HubSpotCompany:
+@dataclass(**_DATACLASS_OPTIONS)
+class HubSpotCompany(_Record):
     """HubSpot company data structure."""
 
     id: Optional[str] = None
@@ -73,69 +116,793 @@ class HubSpotCompany:
     annualrevenue: Optional[float] = None
     properties: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
-        base_dict = {k: v for k, v in self.__dict__.items() if v is not None and k != "properties"}
-        base_dict.update(self.properties)
-        return base_dict
+
+for _record_type in (HubSpotContact, HubSpotDeal, HubSpotCompany):
+    _record_type._FIELDS = tuple(f.name for f in fields(_record_type) if f.name != "properties")
+
+# Properties requested by the contact and company searches and copied onto the records
+_CONTACT_FIELDS = (
+    "email",
+    "firstname",
+    "lastname",
+    "company",
+    "jobtitle",
+    "phone",
+    "website",
+    "lifecyclestage",
+    "lead_status",
+)
+_COMPANY_FIELDS = (
+    "name",
+    "domain",
+    "industry",
+    "city",
+    "state",
+    "country",
+    "numberofemployees",
+    "annualrevenue",
+)
+_CONTACT_PROPERTIES_PAYLOAD = list(_CONTACT_FIELDS)
+_COMPANY_PROPERTIES_PAYLOAD = list(_COMPANY_FIELDS)
+
+# Search filters as (property, operator), in the order of the values each search
+# passes: (email, company, query) for contacts, (domain, industry, query) for companies
+_CONTACT_FILTERS = (("email", "EQ"), ("company", "CONTAINS_TOKEN"), ("email", "CONTAINS_TOKEN"))
+_COMPANY_FILTERS = (("domain", "EQ"), ("industry", "CONTAINS_TOKEN"), ("name", "CONTAINS_TOKEN"))
+
+# Properties read back from create responses
+_CONTACT_CREATE_FIELDS = ("email", "firstname", "lastname", "company", "jobtitle", "phone")
+_DEAL_FIELDS = ("dealname", "amount", "dealstage", "closedate")
+
+# Requests allowed back to back before the limiter settles to the steady rate;
+# HubSpot itself allows 10 requests per second. Keep this at least as large as
+# the number of lookups abulk_context gathers, or they queue on the limiter.
+_RATE_LIMIT_BURST = 10
+
+# Methods _make_request and _amake_request accept
+_HTTP_METHODS = frozenset({"GET", "POST", "PATCH", "DELETE"})
+
+# HubSpot's GraphQL endpoint, which only serves read queries
+_GRAPHQL_ENDPOINT = "collector/graphql"
+
+# Back off once HubSpot reports fewer than this many requests left this second
+_SECONDLY_REMAINING_THRESHOLD = 2
+
+# Below this many requests left for the day, warn and halve the request rate
+# until the daily allowance resets
+_DAILY_REMAINING_THRESHOLD = 1000
+
+# Attempts per request when HubSpot answers 429 or a transient 5xx, and the
+# longest wait between them; server errors are retried on a shorter leash
+_MAX_ATTEMPTS = 5
+_RETRY_MAX_WAIT = 30.0
+_RETRY_MAX_WAIT_5XX = 10.0
+_RETRY_5XX_STATUSES = frozenset({500, 502, 503, 504})
+
+# Read-only lookups answered from memory, with how many seconds each stays fresh.
+# Pipelines rarely change; searches are kept briefly and dropped on writes.
+_CACHE_TTLS = {
+    "crm/v3/pipelines/deals": 3600,
+    "crm/v3/objects/contacts/search": 60,
+    "crm/v3/objects/companies/search": 60,
+}
+_CACHE_MAXSIZE = 1024
+
+# Records per call accepted by HubSpot's batch endpoints
+_BATCH_SIZE = 100
+
+# How long acreate_contact waits for concurrent calls to join the same batch
+_BATCH_WINDOW = 0.05
+
+
+def _cache_key(data: Optional[Dict], params: Optional[Dict]) -> str:
+    """Key a cached lookup on its body and query parameters."""
+    return json.dumps([data, params], sort_keys=True, default=str)
+
+
+def _object_prefix(endpoint: str) -> Optional[str]:
+    """Return the CRM object type prefix of an endpoint, e.g. ``crm/v3/objects/contacts/``."""
+    parts = endpoint.split("/", 4)
+    if len(parts) >= 4 and parts[:3] == ["crm", "v3", "objects"]:
+        return "/".join(parts[:4]) + "/"
+    return None
+
+
+async def _close_on_shutdown(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+    """
+    Keep ``session`` open until this generator is finalized, then close it.
+
+    Once started, the running loop finalizes the generator when it shuts down
+    its async generators (as ``asyncio.run`` does on exit), so a session isn't
+    left open after its loop is gone.
+    """
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+def _is_idempotent(method: str, endpoint: str) -> bool:
+    """Whether a request can be repeated safely; searches, batch reads and GraphQL only read."""
+    return (
+        method != "POST"
+        or endpoint == _GRAPHQL_ENDPOINT
+        or endpoint.endswith(("/search", "/batch/read"))
+    )
+
+
+def _retry_delay(
+    status: int, headers: Mapping[str, str], attempt: int, idempotent: bool
+) -> Optional[float]:
+    """
+    Return how long to wait before retrying a response, or None to stop.
+
+    429s are always retried, as HubSpot rejected the request without acting on
+    it; transient 5xx errors only when the request is idempotent. Retry-After is
+    honoured when sent, otherwise the wait grows exponentially with jitter.
+    """
+    if attempt + 1 >= _MAX_ATTEMPTS:
+        return None
+    if status == 429:
+        cap = _RETRY_MAX_WAIT
+    elif status in _RETRY_5XX_STATUSES and idempotent:
+        cap = _RETRY_MAX_WAIT_5XX
+    else:
+        return None
+
+    retry_after = headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), cap)
+    return min(2.0**attempt, cap) + random.random()
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Convert a HubSpot number property to float, or None if it is empty or malformed."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Convert a HubSpot number property to int, or None if it is empty or malformed."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _compile_mapper(
+    names: Tuple[str, ...], conversions: Tuple[Tuple[str, Callable[[Any], Any]], ...] = ()
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function mapping a CRM object to its id and named properties.
+
+    The result matches the record type's ``to_dict``: unset values are left out,
+    as are converted properties that convert to None, so search results can be
+    emitted without building a record per object.
+    """
+    keys = ("id",) + names
+
+    def mapper(data: Dict[str, Any]) -> Dict[str, Any]:
+        props = data.get("properties") or {}
+        values = (data.get("id"), *map(props.get, names))
+        item = {k: v for k, v in zip(keys, values) if v is not None}
+        for name, convert in conversions:
+            if name in item:
+                value = convert(item[name])
+                if value is None:
+                    del item[name]
+                else:
+                    item[name] = value
+        return item
+
+    return mapper
+
+
+_COMPANY_CONVERSIONS = (("numberofemployees", _to_int), ("annualrevenue", _to_float))
+
+_CONTACT_MAPPER = _compile_mapper(_CONTACT_FIELDS)
+_NEW_CONTACT_MAPPER = _compile_mapper(_CONTACT_CREATE_FIELDS)
+_DEAL_MAPPER = _compile_mapper(_DEAL_FIELDS, (("amount", _to_float),))
+_COMPANY_MAPPER = _compile_mapper(_COMPANY_FIELDS, _COMPANY_CONVERSIONS)
+
+
+def _search_payload(
+    properties: List[str],
+    filter_table: Tuple[Tuple[str, str], ...],
+    values: Tuple[Optional[str], ...],
+    limit: int,
+) -> Dict[str, Any]:
+    """Build a CRM search body, filtering on each table entry whose value is set."""
+    search_data = {"limit": min(limit, 100), "properties": properties}
+
+    filters = [
+        {"propertyName": name, "operator": operator, "value": value}
+        for (name, operator), value in zip(filter_table, values)
+        if value
+    ]
+    if filters:
+        search_data["filterGroups"] = [{"filters": filters}]
+
+    return search_data
+
+
+def _contact_search_payload(
+    query: Optional[str],
+    email: Optional[str],
+    company: Optional[str],
+    limit: int,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Build the CRM search body for search_contacts, requesting only ``fields`` if given."""
+    properties = list(fields) if fields else _CONTACT_PROPERTIES_PAYLOAD
+    return _search_payload(properties, _CONTACT_FILTERS, (email, company, query), limit)
+
+
+def _parse_contact_search(
+    result: Dict[str, Any], query: Optional[str], fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Turn a contacts search response into the search_contacts result."""
+    mapper = _compile_mapper(tuple(fields)) if fields else _CONTACT_MAPPER
+    contacts = [mapper(contact_data) for contact_data in result.get("results", ())]
+
+    return {"contacts": contacts, "total": result.get("total", 0), "query": query}
+
+
+def _contact_properties(
+    email: str,
+    firstname: Optional[str],
+    lastname: Optional[str],
+    company: Optional[str],
+    jobtitle: Optional[str],
+    phone: Optional[str],
+    additional_properties: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Collect the properties for a new contact, skipping empty ones."""
+    properties = {"email": email}
+
+    if firstname:
+        properties["firstname"] = firstname
+    if lastname:
+        properties["lastname"] = lastname
+    if company:
+        properties["company"] = company
+    if jobtitle:
+        properties["jobtitle"] = jobtitle
+    if phone:
+        properties["phone"] = phone
+    if additional_properties:
+        properties.update(additional_properties)
+
+    return properties
+
+
+def _parse_contact(result: Dict[str, Any]) -> HubSpotContact:
+    """Turn a single contact response into a HubSpotContact."""
+    return HubSpotContact(**_NEW_CONTACT_MAPPER(result))
+
+
+def _update_inputs(updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build batch update inputs, rejecting any update without an id and properties."""
+    inputs = []
+    for index, update in enumerate(updates):
+        if not isinstance(update, dict) or not update.get("id") or "properties" not in update:
+            raise ValueError(f"Update {index} needs an 'id' and 'properties'")
+        inputs.append({"id": update["id"], "properties": update["properties"]})
+    return inputs
+
+
+def _deal_payload(
+    dealname: str,
+    amount: float,
+    dealstage: str,
+    contact_id: Optional[str],
+    company_id: Optional[str],
+    closedate: Optional[str],
+    additional_properties: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build the request body for create_deal, including any associations."""
+    properties = {"dealname": dealname, "amount": str(amount), "dealstage": dealstage}
+
+    if closedate:
+        properties["closedate"] = closedate
+    if additional_properties:
+        properties.update(additional_properties)
+
+    deal_data = {"properties": properties}
+
+    # Add associations if provided
+    if contact_id or company_id:
+        associations = []
+        if contact_id:
+            associations.append(
+                {
+                    "to": {"id": contact_id},
+                    "types": [{"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 3}],
+                }
+            )
+        if company_id:
+            associations.append(
+                {
+                    "to": {"id": company_id},
+                    "types": [{"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 5}],
+                }
+            )
+        deal_data["associations"] = associations
+
+    return deal_data
+
+
+def _parse_deal(result: Dict[str, Any]) -> HubSpotDeal:
+    """Turn a single deal response into a HubSpotDeal."""
+    return HubSpotDeal(**_DEAL_MAPPER(result))
+
+
+def _parse_pipelines(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Turn a deal pipelines response into pipelines with their stages."""
+    pipelines = []
+    for pipeline in result.get("results", []):
+        pipeline_info = {
+            "id": pipeline.get("id"),
+            "label": pipeline.get("label"),
+            "stages": [],
+        }
+
+        for stage in pipeline.get("stages", []):
+            stage_info = {
+                "id": stage.get("id"),
+                "label": stage.get("label"),
+                "displayOrder": stage.get("displayOrder"),
+                "probability": stage.get("metadata", {}).get("probability"),
+            }
+            pipeline_info["stages"].append(stage_info)
+
+        pipelines.append(pipeline_info)
+
+    return pipelines
+
+
+def _company_search_payload(
+    query: Optional[str],
+    domain: Optional[str],
+    industry: Optional[str],
+    limit: int,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Build the CRM search body for search_companies, requesting only ``fields`` if given."""
+    properties = list(fields) if fields else _COMPANY_PROPERTIES_PAYLOAD
+    return _search_payload(properties, _COMPANY_FILTERS, (domain, industry, query), limit)
+
+
+def _parse_company(company_data: Dict[str, Any]) -> HubSpotCompany:
+    """Turn a single company record into a HubSpotCompany."""
+    return HubSpotCompany(**_COMPANY_MAPPER(company_data))
+
+
+def _parse_company_search(
+    result: Dict[str, Any], query: Optional[str], fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Turn a companies search response into the search_companies result."""
+    mapper = _compile_mapper(tuple(fields), _COMPANY_CONVERSIONS) if fields else _COMPANY_MAPPER
+    companies = [mapper(company_data) for company_data in result.get("results", ())]
+
+    return {"companies": companies, "total": result.get("total", 0), "query": query}
+
+
+# Page size of the CRM search API, and how far it lets a search be paged
+_SEARCH_PAGE_SIZE = 100
+_SEARCH_MAX_RESULTS = 10_000
+
+
+def _contact_analytics_search(date_range: int) -> Dict[str, Any]:
+    """Build the search for contacts created in the last ``date_range`` days."""
+    # Whole minutes keep the body, and so the lookup cache key, stable between calls
+    cutoff = (int(time.time()) // 60 * 60 - date_range * 86400) * 1000
+    return {
+        "limit": _SEARCH_PAGE_SIZE,
+        "properties": ["email", "lifecyclestage", "lead_status", "createdate"],
+        "sorts": [{"propertyName": "createdate", "direction": "DESCENDING"}],
+        "filterGroups": [
+            {"filters": [{"propertyName": "createdate", "operator": "GTE", "value": str(cutoff)}]}
+        ],
+    }
+
+
+def _tally_contacts(contacts: Iterable[Dict[str, Any]], lifecycle: Counter, leads: Counter) -> int:
+    """Count the contacts' lifecycle stages and lead statuses; return how many were seen."""
+    count = 0
+    for contact in contacts:
+        props = contact.get("properties", {})
+        lifecycle[props.get("lifecyclestage", "Unknown")] += 1
+        leads[props.get("lead_status", "Unknown")] += 1
+        count += 1
+    return count
+
+
+def _iter_search_page(stream: Any, meta: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a streamed CRM search page as they are parsed.
+
+    The page's ``total`` and next-page cursor (as ``after``) are recorded in ``meta``.
+    """
+    events = ijson.parse(stream)
+    for prefix, event, value in events:
+        if prefix == "results.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            for prefix, event, value in events:
+                builder.event(event, value)
+                if prefix == "results.item" and event == "end_map":
+                    break
+            yield builder.value
+        elif prefix == "total":
+            meta["total"] = value
+        elif prefix == "paging.next.after":
+            meta["after"] = value
 
 
 class HubSpotToolkit(Toolkit):
-    """HubSpot API integration toolkit for CRM operations and marketing automation."""
+    """
+    HubSpot API integration toolkit for CRM operations and marketing automation.
+
+    The tools are synchronous. Each also has an ``a``-prefixed coroutine
+    (e.g. ``asearch_contacts``) that runs on a shared aiohttp session, so async
+    callers can issue several CRM calls concurrently; call ``close()`` when done.
+    ``abulk_context`` runs the usual contact, company and pipeline lookups together.
+    """
 
     def __init__(self):
         super().__init__(name="hubspot_toolkit")
         self.settings = get_settings()
         self.api_key = self.settings.marketing_apis.hubspot_api_key
         self.base_url = "https://api.hubapi.com"
+        # Built once and shared by every request on both sessions
+        self._base_url = self.base_url.rstrip("/") + "/"
+        self._auth_header = f"Bearer {self.api_key}" if self.api_key else None
+        self._default_headers = {"Content-Type": "application/json"}
+        if self._auth_header:
+            self._default_headers["Authorization"] = self._auth_header
         self.rate_limit = self.settings.marketing_apis.hubspot_rate_limit
-        self.last_request_time = 0
+        # Upper bound on concurrent requests, applied to the connection pools
+        # and to the async path
+        self.max_inflight = self.settings.marketing_apis.hubspot_max_inflight
+        # Token bucket shared by the sync and async paths: bursts of up to
+        # _RATE_LIMIT_BURST calls go out immediately, then the steady rate applies.
+        self._limiter = TokenBucket.per_minute(self.rate_limit, burst=_RATE_LIMIT_BURST)
+        # Daily allowance HubSpot last reported, and whether the rate is halved for it
+        self.last_daily_remaining: Optional[int] = None
+        self._daily_slowed = False
+        self._daily_lock = threading.Lock()
+
+        # In-memory TTL caches for read-only lookups, one per endpoint
+        self._response_caches = {
+            endpoint: TTLCache(maxsize=_CACHE_MAXSIZE, ttl=ttl)
+            for endpoint, ttl in _CACHE_TTLS.items()
+        }
+        self._cache_lock = threading.Lock()
+
+        # Persistent session: keep-alive connections skip a TLS handshake per call,
+        # and failed connections are retried with backoff by urllib3. 429 and 5xx
+        # responses are retried by _make_request, which also covers POST searches.
+        self.session = requests.Session()
+        self.session.headers.update(self._default_headers)
+        retries = Retry(total=3, backoff_factor=0.5)
+        adapter = HTTPAdapter(
+            pool_connections=self.max_inflight,
+            pool_maxsize=self.max_inflight * 2,
+            max_retries=retries,
+        )
+        self.session.mount("https://", adapter)
+
+        # Created lazily on first async call, as they must belong to a running loop;
+        # rebuilt when called from a different loop (e.g. a later asyncio.run)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_guard: Optional[AsyncIterator[None]] = None
+        # Coalesces concurrent acreate_contact calls into batch creates
+        self._contact_batcher = RequestBatcher(
+            self._aflush_contact_creates, window=_BATCH_WINDOW, max_size=_BATCH_SIZE
+        )
 
         if not self.api_key:
             logger.warning("HubSpot API key not configured")
 
-    def _rate_limit_wait(self):
-        """Implement rate limiting between API calls."""
-        elapsed = time.time() - self.last_request_time
-        min_interval = 60 / self.rate_limit  # requests per minute to seconds per request
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self.last_request_time = time.time()
+    def _update_rate_limit(self, response_headers: Mapping[str, str]) -> None:
+        """Slow down as HubSpot reports its per-second and daily allowances running out."""
+        remaining = response_headers.get("X-HubSpot-RateLimit-Secondly-Remaining")
+        if remaining is not None and remaining.isdigit():
+            remaining = int(remaining)
+            if remaining < _SECONDLY_REMAINING_THRESHOLD:
+                # The secondly window resets within a second
+                self._limiter.throttle(remaining, reset_after=1.0)
+
+        daily = response_headers.get("X-HubSpot-RateLimit-Daily-Remaining")
+        if daily is None or not daily.isdigit():
+            return
+
+        self.last_daily_remaining = int(daily)
+        low = self.last_daily_remaining < _DAILY_REMAINING_THRESHOLD
+        with self._daily_lock:
+            if low == self._daily_slowed:
+                return
+            self._daily_slowed = low
+
+        if low:
+            logger.warning(
+                f"HubSpot daily API allowance nearly spent ({daily} requests left), "
+                "halving request rate"
+            )
+            self._limiter.scale_rate(0.5)
+        else:
+            self._limiter.scale_rate(2.0)
+
+    def _cached_response(self, endpoint: str, key: Optional[str]) -> Optional[Dict]:
+        """Return a fresh cached response for a read-only lookup, if there is one."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            return self._response_caches[endpoint].get(key)
+
+    def _store_response(self, endpoint: str, method: str, key: Optional[str], result: Dict) -> None:
+        """Cache a read-only lookup, or drop cached lookups a write may have changed."""
+        with self._cache_lock:
+            if key is not None:
+                self._response_caches[endpoint][key] = result
+            elif method != "GET":
+                prefix = _object_prefix(endpoint)
+                if prefix:
+                    for cached_endpoint, cache in self._response_caches.items():
+                        if cached_endpoint.startswith(prefix):
+                            cache.clear()
 
     def _make_request(
-        self, endpoint: str, method: str = "GET", data: Dict = None, params: Dict = None
-    ) -> Dict:
-        """Make a rate-limited request to HubSpot API."""
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Dict = None,
+        params: Dict = None,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Make a rate-limited request to HubSpot API, serving cacheable lookups from memory.
+
+        With ``stream=True`` the cache is bypassed and the open response is
+        returned for the caller to parse incrementally and close.
+        """
         if not self.api_key:
             raise ValueError("HubSpot API key not configured")
 
-        self._rate_limit_wait()
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        cacheable = endpoint in self._response_caches and not stream
+        key = _cache_key(data, params) if cacheable else None
+        cached = self._cached_response(endpoint, key)
+        if cached is not None:
+            return cached
 
-        url = f"{self.base_url}/{endpoint}"
-        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        url = self._base_url + endpoint
+        idempotent = _is_idempotent(method, endpoint)
+        # Serialized once up front and reused by any retries; the sessions send
+        # Content-Type: application/json
+        body = None if data is None else json_dumps(data)
 
-        start_time = time.time()
         try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=data, params=params)
-            elif method == "PATCH":
-                response = requests.patch(url, headers=headers, json=data, params=params)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, params=params)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            for attempt in range(_MAX_ATTEMPTS):
+                self._limiter.acquire()
+
+                start_time = time.time()
+                response = self.session.request(
+                    method, url, data=body, params=params, stream=stream, timeout=(5, 30)
+                )
+
+                duration = time.time() - start_time
+                log_api_call("hubspot", endpoint, str(response.status_code), duration)
+                self._update_rate_limit(response.headers)
 
-            duration = time.time() - start_time
-            log_api_call("hubspot", endpoint, str(response.status_code), duration)
+                delay = _retry_delay(response.status_code, response.headers, attempt, idempotent)
+                if delay is None:
+                    break
+                response.close()
+                logger.debug(
+                    f"HubSpot API returned {response.status_code}, retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
 
+            # An error response is never handed to the caller, so release its connection
+            if stream and not response.ok:
+                response.close()
             response.raise_for_status()
-            return response.json() if response.content else {}
+            if stream:
+                return response
+            result = json_loads(response.content) if response.content else {}
+            self._store_response(endpoint, method, key, result)
+            return result
 
         except requests.exceptions.RequestException as e:
             logger.error(f"HubSpot API request failed: {e}")
             raise
 
+    def _iter_search_results(
+        self, endpoint: str, data: Dict[str, Any], meta: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every record of a CRM search, following the paging cursor.
+
+        Pages are parsed as they stream in when ijson is available, so no more
+        than one record is held at a time. Stops after ``_SEARCH_MAX_RESULTS``
+        records; the first page's ``total`` is recorded in ``meta``.
+        """
+        after, fetched = None, 0
+        while True:
+            body = data if after is None else {**data, "after": after}
+            page: Dict[str, Any] = {}
+            if ijson is not None:
+                response = self._make_request(endpoint, "POST", body, stream=True)
+                try:
+                    stream = ijson.from_iter(response.iter_content(chunk_size=64 * 1024))
+                    for record in _iter_search_page(stream, page):
+                        fetched += 1
+                        yield record
+                finally:
+                    response.close()
+            else:
+                result = self._make_request(endpoint, "POST", body)
+                page["after"] = result.get("paging", {}).get("next", {}).get("after")
+                if "total" in result:
+                    page["total"] = result["total"]
+                for record in result.get("results", []):
+                    fetched += 1
+                    yield record
+
+            if after is None and "total" in page:
+                meta["total"] = page["total"]
+            after = page.get("after")
+            if not after or fetched >= _SEARCH_MAX_RESULTS:
+                return
+
+    async def _aget_session(self) -> aiohttp.ClientSession:
+        """Return the running loop's aiohttp session, creating it and its semaphore as needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session belongs to the loop it was created on, so each loop (e.g.
+            # each asyncio.run) gets its own
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_inflight, limit_per_host=self.max_inflight
+                ),
+                headers=self._default_headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+            self._session, self._session_loop = session, loop
+            self._semaphore = asyncio.Semaphore(self.max_inflight)
+            # Close the session when its loop shuts down, even without close()
+            self._session_guard = _close_on_shutdown(session)
+            await self._session_guard.__anext__()
+        return self._session
+
+    async def _amake_request(
+        self, endpoint: str, method: str = "GET", data: Dict = None, params: Dict = None
+    ) -> Dict:
+        """Async variant of _make_request, run on the shared aiohttp session."""
+        if not self.api_key:
+            raise ValueError("HubSpot API key not configured")
+
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        key = _cache_key(data, params) if endpoint in self._response_caches else None
+        cached = self._cached_response(endpoint, key)
+        if cached is not None:
+            return cached
+
+        url = self._base_url + endpoint
+        idempotent = _is_idempotent(method, endpoint)
+        # Serialized once up front and reused by any retries; the sessions send
+        # Content-Type: application/json
+        body = None if data is None else json_dumps(data)
+
+        try:
+            for attempt in range(_MAX_ATTEMPTS):
+                await self._limiter.aacquire()
+
+                session = await self._aget_session()
+                async with self._semaphore:
+                    start_time = time.time()
+                    async with session.request(method, url, data=body, params=params) as response:
+                        duration = time.time() - start_time
+                        log_api_call("hubspot", endpoint, str(response.status), duration)
+                        self._update_rate_limit(response.headers)
+
+                        delay = _retry_delay(response.status, response.headers, attempt, idempotent)
+                        if delay is None:
+                            response.raise_for_status()
+                            content = await response.read()
+                            result = json_loads(content) if content else {}
+                            self._store_response(endpoint, method, key, result)
+                            return result
+
+                logger.debug(f"HubSpot API returned {response.status}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        except aiohttp.ClientError as e:
+            logger.error(f"HubSpot API request failed: {e}")
+            raise
+
+    async def close(self) -> None:
+        """Close the shared aiohttp session used by the async methods."""
+        await self._contact_batcher.close()
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_loop is asyncio.get_running_loop()
+        ):
+            await self._session.close()
+        self._session = None
+        self._semaphore = None
+        self._session_loop = None
+        self._session_guard = None
+
+    def _batch_write(
+        self, object_type: str, action: str, inputs: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Send records to a CRM batch endpoint, _BATCH_SIZE per call.
+
+        Returns the records HubSpot reported back and any error messages; a
+        failed call is reported as an error for its chunk without stopping the rest.
+        """
+        endpoint = f"crm/v3/objects/{object_type}/batch/{action}"
+        results, errors = [], []
+        for start in range(0, len(inputs), _BATCH_SIZE):
+            chunk = inputs[start : start + _BATCH_SIZE]
+            try:
+                response = self._make_request(endpoint, "POST", {"inputs": chunk})
+            except Exception as e:
+                logger.error(f"Failed to batch {action} {object_type}: {e}")
+                errors.append(f"Records {start}-{start + len(chunk) - 1}: {e}")
+                continue
+
+            results.extend(response.get("results", []))
+            errors.extend(error.get("message", str(error)) for error in response.get("errors", []))
+
+        return results, errors
+
+    async def _abatch_write(
+        self, object_type: str, action: str, inputs: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Async variant of _batch_write; chunks are sent concurrently."""
+        endpoint = f"crm/v3/objects/{object_type}/batch/{action}"
+        starts = range(0, len(inputs), _BATCH_SIZE)
+        responses = await asyncio.gather(
+            *(
+                self._amake_request(
+                    endpoint, "POST", {"inputs": inputs[start : start + _BATCH_SIZE]}
+                )
+                for start in starts
+            ),
+            return_exceptions=True,
+        )
+
+        results, errors = [], []
+        for start, response in zip(starts, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Failed to batch {action} {object_type}: {response}")
+                end = min(start + _BATCH_SIZE, len(inputs)) - 1
+                errors.append(f"Records {start}-{end}: {response}")
+                continue
+
+            results.extend(response.get("results", []))
+            errors.extend(error.get("message", str(error)) for error in response.get("errors", []))
+
+        return results, errors
+
     @tool
     def search_contacts(
         self,
@@ -143,6 +910,7 @@ class HubSpotToolkit(Toolkit):
         email: Optional[str] = None,
         company: Optional[str] = None,
         limit: int = 100,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Search for contacts in HubSpot CRM.
@@ -152,63 +920,38 @@ class HubSpotToolkit(Toolkit):
             email: Email address to search for
             company: Company name to filter by
             limit: Maximum number of contacts to return
+            fields: Properties to return for each of the contacts; defaults to the
+                standard set. Asking for fewer keeps responses small.
 
         Returns:
             Dictionary containing matching contacts
         """
-        search_data = {
-            "limit": min(limit, 100),
-            "properties": [
-                "email",
-                "firstname",
-                "lastname",
-                "company",
-                "jobtitle",
-                "phone",
-                "website",
-                "lifecyclestage",
-                "lead_status",
-            ],
-        }
-
-        filters = []
-        if email:
-            filters.append({"propertyName": "email", "operator": "EQ", "value": email})
-        if company:
-            filters.append(
-                {"propertyName": "company", "operator": "CONTAINS_TOKEN", "value": company}
-            )
-        if query:
-            filters.append({"propertyName": "email", "operator": "CONTAINS_TOKEN", "value": query})
-
-        if filters:
-            search_data["filterGroups"] = [{"filters": filters}]
+        search_data = _contact_search_payload(query, email, company, limit, fields)
 
         try:
             result = self._make_request("crm/v3/objects/contacts/search", "POST", search_data)
+            return _parse_contact_search(result, query or email or company, fields)
 
-            contacts = []
-            for contact_data in result.get("results", []):
-                props = contact_data.get("properties", {})
-                contact = HubSpotContact(
-                    id=contact_data.get("id"),
-                    email=props.get("email"),
-                    firstname=props.get("firstname"),
-                    lastname=props.get("lastname"),
-                    company=props.get("company"),
-                    jobtitle=props.get("jobtitle"),
-                    phone=props.get("phone"),
-                    website=props.get("website"),
-                    lifecyclestage=props.get("lifecyclestage"),
-                    lead_status=props.get("lead_status"),
-                )
-                contacts.append(contact.to_dict())
+        except Exception as e:
+            logger.error(f"Failed to search contacts: {e}")
+            return {"contacts": [], "total": 0, "error": str(e)}
 
-            return {
-                "contacts": contacts,
-                "total": result.get("total", 0),
-                "query": query or email or company,
-            }
+    async def asearch_contacts(
+        self,
+        query: Optional[str] = None,
+        email: Optional[str] = None,
+        company: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of search_contacts."""
+        search_data = _contact_search_payload(query, email, company, limit, fields)
+
+        try:
+            result = await self._amake_request(
+                "crm/v3/objects/contacts/search", "POST", search_data
+            )
+            return _parse_contact_search(result, query or email or company, fields)
 
         except Exception as e:
             logger.error(f"Failed to search contacts: {e}")
@@ -240,43 +983,91 @@ class HubSpotToolkit(Toolkit):
         Returns:
             Dictionary containing created contact information
         """
-        properties = {"email": email}
+        properties = _contact_properties(
+            email, firstname, lastname, company, jobtitle, phone, additional_properties
+        )
+
+        try:
+            result = self._make_request(
+                "crm/v3/objects/contacts", "POST", {"properties": properties}
+            )
+            contact = _parse_contact(result)
+            return {"contact": contact.to_dict(), "created": True, "id": result.get("id")}
+
+        except Exception as e:
+            logger.error(f"Failed to create contact: {e}")
+            return {"contact": None, "created": False, "error": str(e)}
 
-        if firstname:
-            properties["firstname"] = firstname
-        if lastname:
-            properties["lastname"] = lastname
-        if company:
-            properties["company"] = company
-        if jobtitle:
-            properties["jobtitle"] = jobtitle
-        if phone:
-            properties["phone"] = phone
-        if additional_properties:
-            properties.update(additional_properties)
+    async def acreate_contact(
+        self,
+        email: str,
+        firstname: Optional[str] = None,
+        lastname: Optional[str] = None,
+        company: Optional[str] = None,
+        jobtitle: Optional[str] = None,
+        phone: Optional[str] = None,
+        additional_properties: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of create_contact.
 
-        contact_data = {"properties": properties}
+        Concurrent calls made within a short window are sent as one batch create.
+        """
+        properties = _contact_properties(
+            email, firstname, lastname, company, jobtitle, phone, additional_properties
+        )
+        return await self._contact_batcher.submit(properties)
 
+    async def _acreate_contact_now(self, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a single contact straight away."""
         try:
-            result = self._make_request("crm/v3/objects/contacts", "POST", contact_data)
-
-            props = result.get("properties", {})
-            contact = HubSpotContact(
-                id=result.get("id"),
-                email=props.get("email"),
-                firstname=props.get("firstname"),
-                lastname=props.get("lastname"),
-                company=props.get("company"),
-                jobtitle=props.get("jobtitle"),
-                phone=props.get("phone"),
+            result = await self._amake_request(
+                "crm/v3/objects/contacts", "POST", {"properties": properties}
             )
-
+            contact = _parse_contact(result)
             return {"contact": contact.to_dict(), "created": True, "id": result.get("id")}
 
         except Exception as e:
             logger.error(f"Failed to create contact: {e}")
             return {"contact": None, "created": False, "error": str(e)}
 
+    async def _aflush_contact_creates(
+        self, property_sets: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Create the contacts queued by acreate_contact, batching them when there are several."""
+        if len(property_sets) == 1:
+            return [await self._acreate_contact_now(property_sets[0])]
+
+        try:
+            response = await self._amake_request(
+                "crm/v3/objects/contacts/batch/create",
+                "POST",
+                {"inputs": [{"properties": properties} for properties in property_sets]},
+            )
+        except Exception as e:
+            # A single invalid record fails the whole batch; create them one by one
+            logger.warning(f"Batch contact create failed, creating individually: {e}")
+            return await asyncio.gather(*map(self._acreate_contact_now, property_sets))
+
+        # Batch results are not guaranteed to come back in input order
+        created = {
+            (result.get("properties", {}).get("email") or "").lower(): result
+            for result in response.get("results", [])
+        }
+        outcomes = []
+        for properties in property_sets:
+            result = created.get(properties["email"].lower())
+            if result is None:
+                outcomes.append(
+                    {"contact": None, "created": False, "error": "Contact not created in batch"}
+                )
+            else:
+                contact = _parse_contact(result)
+                outcomes.append(
+                    {"contact": contact.to_dict(), "created": True, "id": result.get("id")}
+                )
+        return outcomes
+
     @tool
     def update_contact(self, contact_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -295,24 +1086,96 @@ class HubSpotToolkit(Toolkit):
             result = self._make_request(
                 f"crm/v3/objects/contacts/{contact_id}", "PATCH", update_data
             )
+            return {"contact": _parse_contact(result).to_dict(), "updated": True}
 
-            props = result.get("properties", {})
-            contact = HubSpotContact(
-                id=result.get("id"),
-                email=props.get("email"),
-                firstname=props.get("firstname"),
-                lastname=props.get("lastname"),
-                company=props.get("company"),
-                jobtitle=props.get("jobtitle"),
-                phone=props.get("phone"),
-            )
+        except Exception as e:
+            logger.error(f"Failed to update contact: {e}")
+            return {"contact": None, "updated": False, "error": str(e)}
+
+    async def aupdate_contact(self, contact_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of update_contact."""
+        update_data = {"properties": properties}
 
-            return {"contact": contact.to_dict(), "updated": True}
+        try:
+            result = await self._amake_request(
+                f"crm/v3/objects/contacts/{contact_id}", "PATCH", update_data
+            )
+            return {"contact": _parse_contact(result).to_dict(), "updated": True}
 
         except Exception as e:
             logger.error(f"Failed to update contact: {e}")
             return {"contact": None, "updated": False, "error": str(e)}
 
+    @tool
+    def batch_create_contacts(self, contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many contacts in HubSpot CRM using the batch API.
+
+        Args:
+            contacts: Contact properties to create, one dictionary per contact
+                (e.g. {"email": ..., "firstname": ...})
+
+        Returns:
+            Dictionary containing created contacts and any errors
+        """
+        inputs = [{"properties": properties} for properties in contacts]
+        results, errors = self._batch_write("contacts", "create", inputs)
+        return {
+            "contacts": [_parse_contact(result).to_dict() for result in results],
+            "created": len(results),
+            "errors": errors,
+        }
+
+    async def abatch_create_contacts(self, contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async variant of batch_create_contacts."""
+        inputs = [{"properties": properties} for properties in contacts]
+        results, errors = await self._abatch_write("contacts", "create", inputs)
+        return {
+            "contacts": [_parse_contact(result).to_dict() for result in results],
+            "created": len(results),
+            "errors": errors,
+        }
+
+    @tool
+    def batch_update_contacts(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Update many existing contacts in HubSpot CRM using the batch API.
+
+        Args:
+            updates: One dictionary per contact with its "id" and the
+                "properties" to update
+
+        Returns:
+            Dictionary containing updated contacts and any errors
+        """
+        try:
+            inputs = _update_inputs(updates)
+        except ValueError as e:
+            logger.error(f"Failed to batch update contacts: {e}")
+            return {"contacts": [], "updated": 0, "errors": [], "error": str(e)}
+
+        results, errors = self._batch_write("contacts", "update", inputs)
+        return {
+            "contacts": [_parse_contact(result).to_dict() for result in results],
+            "updated": len(results),
+            "errors": errors,
+        }
+
+    async def abatch_update_contacts(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async variant of batch_update_contacts."""
+        try:
+            inputs = _update_inputs(updates)
+        except ValueError as e:
+            logger.error(f"Failed to batch update contacts: {e}")
+            return {"contacts": [], "updated": 0, "errors": [], "error": str(e)}
+
+        results, errors = await self._abatch_write("contacts", "update", inputs)
+        return {
+            "contacts": [_parse_contact(result).to_dict() for result in results],
+            "updated": len(results),
+            "errors": errors,
+        }
+
     @tool
     def create_deal(
         self,
@@ -339,56 +1202,73 @@ class HubSpotToolkit(Toolkit):
         Returns:
             Dictionary containing created deal information
         """
-        properties = {"dealname": dealname, "amount": str(amount), "dealstage": dealstage}
-
-        if closedate:
-            properties["closedate"] = closedate
-        if additional_properties:
-            properties.update(additional_properties)
-
-        deal_data = {"properties": properties}
-
-        # Add associations if provided
-        if contact_id or company_id:
-            associations = []
-            if contact_id:
-                associations.append(
-                    {
-                        "to": {"id": contact_id},
-                        "types": [
-                            {"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 3}
-                        ],
-                    }
-                )
-            if company_id:
-                associations.append(
-                    {
-                        "to": {"id": company_id},
-                        "types": [
-                            {"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 5}
-                        ],
-                    }
-                )
-            deal_data["associations"] = associations
+        deal_data = _deal_payload(
+            dealname, amount, dealstage, contact_id, company_id, closedate, additional_properties
+        )
 
         try:
             result = self._make_request("crm/v3/objects/deals", "POST", deal_data)
+            deal = _parse_deal(result)
+            return {"deal": deal.to_dict(), "created": True, "id": result.get("id")}
 
-            props = result.get("properties", {})
-            deal = HubSpotDeal(
-                id=result.get("id"),
-                dealname=props.get("dealname"),
-                amount=float(props.get("amount", 0)) if props.get("amount") else None,
-                dealstage=props.get("dealstage"),
-                closedate=props.get("closedate"),
-            )
+        except Exception as e:
+            logger.error(f"Failed to create deal: {e}")
+            return {"deal": None, "created": False, "error": str(e)}
+
+    async def acreate_deal(
+        self,
+        dealname: str,
+        amount: float,
+        dealstage: str,
+        contact_id: Optional[str] = None,
+        company_id: Optional[str] = None,
+        closedate: Optional[str] = None,
+        additional_properties: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of create_deal."""
+        deal_data = _deal_payload(
+            dealname, amount, dealstage, contact_id, company_id, closedate, additional_properties
+        )
 
+        try:
+            result = await self._amake_request("crm/v3/objects/deals", "POST", deal_data)
+            deal = _parse_deal(result)
             return {"deal": deal.to_dict(), "created": True, "id": result.get("id")}
 
         except Exception as e:
             logger.error(f"Failed to create deal: {e}")
             return {"deal": None, "created": False, "error": str(e)}
 
+    @tool
+    def batch_create_deals(self, deals: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many deals in HubSpot CRM using the batch API.
+
+        Args:
+            deals: Deal properties to create, one dictionary per deal
+                (e.g. {"dealname": ..., "amount": ..., "dealstage": ...})
+
+        Returns:
+            Dictionary containing created deals and any errors
+        """
+        inputs = [{"properties": properties} for properties in deals]
+        results, errors = self._batch_write("deals", "create", inputs)
+        return {
+            "deals": [_parse_deal(result).to_dict() for result in results],
+            "created": len(results),
+            "errors": errors,
+        }
+
+    async def abatch_create_deals(self, deals: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async variant of batch_create_deals."""
+        inputs = [{"properties": properties} for properties in deals]
+        results, errors = await self._abatch_write("deals", "create", inputs)
+        return {
+            "deals": [_parse_deal(result).to_dict() for result in results],
+            "created": len(results),
+            "errors": errors,
+        }
+
     @tool
     def get_deal_pipeline(self) -> Dict[str, Any]:
         """
@@ -399,27 +1279,17 @@ class HubSpotToolkit(Toolkit):
         """
         try:
             result = self._make_request("crm/v3/pipelines/deals")
+            return {"pipelines": _parse_pipelines(result)}
 
-            pipelines = []
-            for pipeline in result.get("results", []):
-                pipeline_info = {
-                    "id": pipeline.get("id"),
-                    "label": pipeline.get("label"),
-                    "stages": [],
-                }
-
-                for stage in pipeline.get("stages", []):
-                    stage_info = {
-                        "id": stage.get("id"),
-                        "label": stage.get("label"),
-                        "displayOrder": stage.get("displayOrder"),
-                        "probability": stage.get("metadata", {}).get("probability"),
-                    }
-                    pipeline_info["stages"].append(stage_info)
-
-                pipelines.append(pipeline_info)
+        except Exception as e:
+            logger.error(f"Failed to get deal pipeline: {e}")
+            return {"pipelines": [], "error": str(e)}
 
-            return {"pipelines": pipelines}
+    async def aget_deal_pipeline(self) -> Dict[str, Any]:
+        """Async variant of get_deal_pipeline."""
+        try:
+            result = await self._amake_request("crm/v3/pipelines/deals")
+            return {"pipelines": _parse_pipelines(result)}
 
         except Exception as e:
             logger.error(f"Failed to get deal pipeline: {e}")
@@ -432,6 +1302,7 @@ class HubSpotToolkit(Toolkit):
         domain: Optional[str] = None,
         industry: Optional[str] = None,
         limit: int = 100,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Search for companies in HubSpot CRM.
@@ -441,72 +1312,102 @@ class HubSpotToolkit(Toolkit):
             domain: Company domain to search for
             industry: Industry to filter by
             limit: Maximum number of companies to return
+            fields: Properties to return for each of the companies; defaults to the
+                standard set. Asking for fewer keeps responses small.
 
         Returns:
             Dictionary containing matching companies
         """
-        search_data = {
-            "limit": min(limit, 100),
-            "properties": [
-                "name",
-                "domain",
-                "industry",
-                "city",
-                "state",
-                "country",
-                "numberofemployees",
-                "annualrevenue",
-            ],
-        }
-
-        filters = []
-        if domain:
-            filters.append({"propertyName": "domain", "operator": "EQ", "value": domain})
-        if industry:
-            filters.append(
-                {"propertyName": "industry", "operator": "CONTAINS_TOKEN", "value": industry}
-            )
-        if query:
-            filters.append({"propertyName": "name", "operator": "CONTAINS_TOKEN", "value": query})
-
-        if filters:
-            search_data["filterGroups"] = [{"filters": filters}]
+        search_data = _company_search_payload(query, domain, industry, limit, fields)
 
         try:
             result = self._make_request("crm/v3/objects/companies/search", "POST", search_data)
+            return _parse_company_search(result, query or domain or industry, fields)
 
-            companies = []
-            for company_data in result.get("results", []):
-                props = company_data.get("properties", {})
-                company = HubSpotCompany(
-                    id=company_data.get("id"),
-                    name=props.get("name"),
-                    domain=props.get("domain"),
-                    industry=props.get("industry"),
-                    city=props.get("city"),
-                    state=props.get("state"),
-                    country=props.get("country"),
-                    numberofemployees=(
-                        int(props.get("numberofemployees", 0))
-                        if props.get("numberofemployees")
-                        else None
-                    ),
-                    annualrevenue=(
-                        float(props.get("annualrevenue", 0)) if props.get("annualrevenue") else None
-                    ),
-                )
-                companies.append(company.to_dict())
+        except Exception as e:
+            logger.error(f"Failed to search companies: {e}")
+            return {"companies": [], "total": 0, "error": str(e)}
 
-            return {
-                "companies": companies,
-                "total": result.get("total", 0),
-                "query": query or domain or industry,
-            }
+    async def asearch_companies(
+        self,
+        query: Optional[str] = None,
+        domain: Optional[str] = None,
+        industry: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of search_companies."""
+        search_data = _company_search_payload(query, domain, industry, limit, fields)
+
+        try:
+            result = await self._amake_request(
+                "crm/v3/objects/companies/search", "POST", search_data
+            )
+            return _parse_company_search(result, query or domain or industry, fields)
 
         except Exception as e:
             logger.error(f"Failed to search companies: {e}")
             return {"companies": [], "total": 0, "error": str(e)}
 
+    async def abulk_context(
+        self, email: Optional[str] = None, domain: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Look up a contact, their company and the deal pipelines concurrently.
+
+        Args:
+            email: Email address of the contact
+            domain: Domain of the contact's company
+
+        Returns:
+            Dictionary with the search_contacts, search_companies and
+            get_deal_pipeline results under "contacts", "companies" and "pipelines"
+        """
+        results = await asyncio.gather(
+            self.asearch_contacts(email=email),
+            self.asearch_companies(domain=domain),
+            self.aget_deal_pipeline(),
+            return_exceptions=True,
+        )
+
+        context = {}
+        for key, result in zip(("contacts", "companies", "pipelines"), results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to get {key} context: {result}")
+                result = {"error": str(result)}
+            context[key] = result
+        return context
+
+    @tool
+    def batch_create_companies(self, companies: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many companies in HubSpot CRM using the batch API.
+
+        Args:
+            companies: Company properties to create, one dictionary per company
+                (e.g. {"name": ..., "domain": ...})
+
+        Returns:
+            Dictionary containing created companies and any errors
+        """
+        inputs = [{"properties": properties} for properties in companies]
+        results, errors = self._batch_write("companies", "create", inputs)
+        return {
+            "companies": [_parse_company(result).to_dict() for result in results],
+            "created": len(results),
+            "errors": errors,
+        }
+
+    async def abatch_create_companies(self, companies: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async variant of batch_create_companies."""
+        inputs = [{"properties": properties} for properties in companies]
+        results, errors = await self._abatch_write("companies", "create", inputs)
+        return {
+            "companies": [_parse_company(result).to_dict() for result in results],
+            "created": len(results),
+            "errors": errors,
+        }
+
     @tool
     def get_contact_analytics(self, date_range: int = 30) -> Dict[str, Any]:
         """
@@ -518,40 +1419,110 @@ class HubSpotToolkit(Toolkit):
         Returns:
             Dictionary containing contact analytics
         """
+        search_data = _contact_analytics_search(date_range)
+        lifecycle, leads = Counter(), Counter()
+
+        meta: Dict[str, Any] = {}
+
         try:
-            # Get recent contacts
-            search_data = {
-                "limit": 100,
-                "properties": ["email", "lifecyclestage", "lead_status", "createdate"],
-                "sorts": [{"propertyName": "createdate", "direction": "DESCENDING"}],
+            # Tally every contact created in the range as the pages stream in
+            contacts = self._iter_search_results(
+                "crm/v3/objects/contacts/search", search_data, meta
+            )
+            analysed = _tally_contacts(contacts, lifecycle, leads)
+
+            return {
+                "total_contacts": meta.get("total", analysed),
+                "lifecycle_stages": dict(lifecycle),
+                "lead_statuses": dict(leads),
+                "recent_contacts": analysed,
             }
 
-            result = self._make_request("crm/v3/objects/contacts/search", "POST", search_data)
+        except Exception as e:
+            logger.error(f"Failed to get contact analytics: {e}")
+            return {"error": str(e)}
 
-            # Analyze the data
-            contacts = result.get("results", [])
-            analytics = {
-                "total_contacts": len(contacts),
-                "lifecycle_stages": {},
-                "lead_statuses": {},
-                "recent_contacts": len(contacts),
-            }
+    async def aget_contact_analytics(self, date_range: int = 30) -> Dict[str, Any]:
+        """
+        Async variant of get_contact_analytics.
 
-            for contact in contacts:
-                props = contact.get("properties", {})
+        Once the first page reports the total, the remaining pages are fetched
+        concurrently by offset.
+        """
+        search_data = _contact_analytics_search(date_range)
+        lifecycle, leads = Counter(), Counter()
 
-                # Count lifecycle stages
-                stage = props.get("lifecyclestage", "Unknown")
-                analytics["lifecycle_stages"][stage] = (
-                    analytics["lifecycle_stages"].get(stage, 0) + 1
+        try:
+            result = await self._amake_request(
+                "crm/v3/objects/contacts/search", "POST", search_data
+            )
+            total = result.get("total", 0)
+
+            pages = await asyncio.gather(
+                *(
+                    self._amake_request(
+                        "crm/v3/objects/contacts/search",
+                        "POST",
+                        {**search_data, "after": str(offset)},
+                    )
+                    for offset in range(
+                        _SEARCH_PAGE_SIZE, min(total, _SEARCH_MAX_RESULTS), _SEARCH_PAGE_SIZE
+                    )
                 )
+            )
 
-                # Count lead statuses
-                status = props.get("lead_status", "Unknown")
-                analytics["lead_statuses"][status] = analytics["lead_statuses"].get(status, 0) + 1
+            analysed = _tally_contacts(result.get("results", []), lifecycle, leads)
+            for page in pages:
+                analysed += _tally_contacts(page.get("results", []), lifecycle, leads)
 
-            return analytics
+            return {
+                "total_contacts": result.get("total", analysed),
+                "lifecycle_stages": dict(lifecycle),
+                "lead_statuses": dict(leads),
+                "recent_contacts": analysed,
+            }
 
         except Exception as e:
             logger.error(f"Failed to get contact analytics: {e}")
             return {"error": str(e)}
+
+    @tool
+    def graphql_query(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a GraphQL query against HubSpot CRM data.
+
+        A single query can fetch a record together with its associated contacts,
+        companies and deals, replacing a chain of search and association calls.
+
+        Args:
+            query: GraphQL query to run
+            variables: Values for the query's variables
+
+        Returns:
+            Dictionary containing the query data and any GraphQL errors
+        """
+        try:
+            result = self._make_request(
+                _GRAPHQL_ENDPOINT, "POST", {"query": query, "variables": variables or {}}
+            )
+            return {"data": result.get("data"), "errors": result.get("errors", [])}
+
+        except Exception as e:
+            logger.error(f"Failed to run GraphQL query: {e}")
+            return {"data": None, "errors": [], "error": str(e)}
+
+    async def agraphql_query(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Async variant of graphql_query."""
+        try:
+            result = await self._amake_request(
+                _GRAPHQL_ENDPOINT, "POST", {"query": query, "variables": variables or {}}
+            )
+            return {"data": result.get("data"), "errors": result.get("errors", [])}
+
+        except Exception as e:
+            logger.error(f"Failed to run GraphQL query: {e}")
+            return {"data": None, "errors": [], "error": str(e)}
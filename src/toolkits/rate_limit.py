@@ -0,0 +1,77 @@
+"""
+Rate limiting helpers shared by the API toolkits.
+
+Provides a thread-safe token bucket that can be awaited from async code or
+blocked on from synchronous code, allowing short bursts while holding the
+long-term request rate to the provider's limit.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket holding up to ``capacity`` tokens, refilled at ``refill_rate`` per second."""
+
+    capacity: float
+    refill_rate: float
+    tokens: Optional[float] = None
+    last_refill: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.tokens is None:
+            self.tokens = self.capacity
+
+    @classmethod
+    def per_minute(cls, rate_limit: int, burst: Optional[int] = None) -> "TokenBucket":
+        """Create a bucket for ``rate_limit`` requests per minute, bursting up to ``burst``."""
+        return cls(capacity=float(burst or rate_limit), refill_rate=rate_limit / 60)
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            # Going negative queues callers: each one waits for its own token to refill
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.refill_rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Wait asynchronously until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def scale_rate(self, factor: float) -> None:
+        """Multiply the steady refill rate by ``factor``, e.g. to back off from a quota."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.refill_rate *= factor
+
+    def throttle(self, remaining: int, reset_after: float = 0.0) -> None:
+        """
+        Align the bucket with quota reported by the server.
+
+        Caps the available tokens at ``remaining``; when nothing remains, further
+        callers are held back until ``reset_after`` seconds from now.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, float(remaining))
+            if remaining <= 0:
+                # The next token then becomes available exactly ``reset_after`` from now
+                self.tokens = min(self.tokens, 1 - reset_after * self.refill_rate)
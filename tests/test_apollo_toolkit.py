@@ -0,0 +1,100 @@
+"""Tests for the Apollo toolkit, run against a mocked Apollo API."""
+
+import json
+
+import httpx
+import pytest
+
+from src.toolkits.apollo_toolkit import ApolloToolkit
+
+REFERENCE_ORG = {
+    "id": "ref",
+    "name": "Acme",
+    "primary_domain": "acme.com",
+    "primary_industry": {"industry": "software"},
+}
+OTHER_ORGS = [
+    {"id": f"org{i}", "name": f"Company {i}", "primary_domain": f"company{i}.com"} for i in range(5)
+]
+
+
+def _toolkit(handler) -> ApolloToolkit:
+    toolkit = ApolloToolkit()
+    toolkit.api_key = "test-key"
+    toolkit.rate_limit = toolkit.max_rate_limit = 6000
+    toolkit.session = httpx.Client(transport=httpx.MockTransport(handler))
+    return toolkit
+
+
+def _call(toolkit: ApolloToolkit, name: str, *args, **kwargs):
+    return getattr(toolkit, name).entrypoint(toolkit, *args, **kwargs)
+
+
+def _similar_companies_api(search):
+    """Mock Apollo API that enriches to the reference company and answers searches via ``search``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("organizations/enrich"):
+            return httpx.Response(200, json={"organization": REFERENCE_ORG})
+        if request.url.path.endswith("mixed_companies/search"):
+            return search(json.loads(request.content))
+        return httpx.Response(404)
+
+    return handler
+
+
+@pytest.mark.unit
+def test_find_similar_companies_drops_reference_when_exclusion_is_ignored():
+    searches = []
+
+    def search(body):
+        # Accept organization_not_ids but ignore it, returning the reference first
+        searches.append(body)
+        organizations = [REFERENCE_ORG] + OTHER_ORGS
+        return httpx.Response(200, json={"organizations": organizations[: body["per_page"]]})
+
+    toolkit = _toolkit(_similar_companies_api(search))
+    result = _call(toolkit, "find_similar_companies", "https://www.Acme.com/", limit=3)
+
+    assert searches[0]["organization_not_ids"] == ["ref"]
+    assert [company["id"] for company in result["companies"]] == ["org0", "org1", "org2"]
+    assert result["total_found"] == 3
+
+
+@pytest.mark.unit
+def test_find_similar_companies_filters_locally_when_exclusion_is_rejected():
+    searches = []
+
+    def search(body):
+        searches.append(body)
+        if "organization_not_ids" in body:
+            return httpx.Response(422, json={"error": "unknown parameter"})
+        organizations = [REFERENCE_ORG] + OTHER_ORGS
+        return httpx.Response(200, json={"organizations": organizations[: body["per_page"]]})
+
+    toolkit = _toolkit(_similar_companies_api(search))
+    result = _call(toolkit, "find_similar_companies", "acme.com", limit=2)
+
+    assert len(searches) == 2
+    assert "organization_not_ids" not in searches[1]
+    assert [company["id"] for company in result["companies"]] == ["org0", "org1"]
+
+
+@pytest.mark.unit
+def test_error_summary_counts_retried_and_terminal_failures(monkeypatch):
+    monkeypatch.setattr("src.toolkits.apollo_toolkit.time.sleep", lambda seconds: None)
+    statuses = iter([429, 200, 500])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        headers = {"Retry-After": "0"} if status == 429 else {}
+        return httpx.Response(status, headers=headers, json={"person": {"id": "p1"}})
+
+    toolkit = _toolkit(handler)
+    assert toolkit.error_summary() == {}
+
+    assert "error" not in _call(toolkit, "enrich_contact", "first@example.com")
+    assert toolkit.error_summary() == {"http_429_retried": 1}
+
+    assert "error" in _call(toolkit, "enrich_contact", "second@example.com")
+    assert toolkit.error_summary() == {"http_429_retried": 1, "http_500": 1}
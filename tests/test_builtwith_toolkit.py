@@ -0,0 +1,78 @@
+"""Tests for the BuiltWith toolkit, run against a stubbed v20 lookup API."""
+
+import json
+
+import pytest
+
+from src.toolkits import builtwith_toolkit
+from src.toolkits.builtwith_toolkit import BuiltWithToolkit
+
+TECHNOLOGIES = {
+    "example.com": [("Analytics", "Google Analytics"), ("CMS", "WordPress")],
+    "acme.io": [("Analytics", "Hotjar")],
+}
+
+
+def _lookup_body(lookup: str) -> bytes:
+    """A v20 lookup response for a comma-separated LOOKUP, echoing each domain back."""
+    results = []
+    for domain in lookup.split(","):
+        groups = [
+            {"Name": category, "Categories": [{"Name": name, "FirstDetected": 1600000000}]}
+            for category, name in TECHNOLOGIES.get(domain, ())
+        ]
+        if groups:
+            results.append(
+                {
+                    "Lookup": domain,
+                    "FirstIndexed": 1500000000,
+                    "Result": {"Paths": [{"Technologies": groups}]},
+                }
+            )
+    return json.dumps({"Results": results}).encode()
+
+
+@pytest.fixture(params=["msgspec", "dict"])
+def toolkit(request, monkeypatch, tmp_path):
+    if request.param == "dict":
+        monkeypatch.setattr(builtwith_toolkit, "_LOOKUP_DECODER", None)
+    elif builtwith_toolkit._LOOKUP_DECODER is None:
+        pytest.skip("msgspec is not installed")
+
+    # Keep the on-disk response cache out of the working tree
+    monkeypatch.chdir(tmp_path)
+    toolkit = BuiltWithToolkit()
+    toolkit.api_key = "test-key"
+    toolkit.lookups = []
+
+    def make_request(endpoint, params=None, decode=json.loads):
+        toolkit.lookups.append(params["LOOKUP"])
+        return decode(_lookup_body(params["LOOKUP"]))
+
+    monkeypatch.setattr(toolkit, "_make_request", make_request)
+    return toolkit
+
+
+@pytest.mark.unit
+def test_compare_matches_url_and_case_variants_in_one_batch(toolkit):
+    domains = ["https://www.Example.com/", "ACME.io ", "example.com", "missing.org"]
+
+    result = toolkit.compare_technology_stacks.entrypoint(toolkit, domains)
+
+    assert toolkit.lookups == ["example.com,acme.io,missing.org"]
+    assert result["domains"] == ["example.com", "acme.io"]
+    assert result["category_comparison"] == {
+        "example.com": {"Analytics": 1, "CMS": 1},
+        "acme.io": {"Analytics": 1},
+    }
+
+
+@pytest.mark.unit
+def test_domain_lookup_is_keyed_by_canonical_domain(toolkit):
+    profile = toolkit.get_domain_technologies.entrypoint(toolkit, "http://www.ACME.io/pricing")
+
+    assert profile["domain"] == "acme.io"
+    assert [tech["name"] for tech in profile["technologies"]] == ["Hotjar"]
+    # The in-memory profile cache answers other spellings of the same domain
+    toolkit.get_domain_technologies.entrypoint(toolkit, "acme.io")
+    assert toolkit.lookups == ["acme.io"]
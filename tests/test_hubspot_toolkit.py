@@ -0,0 +1,43 @@
+"""Tests for the HubSpot toolkit, run against a stubbed requests session."""
+
+import io
+
+import pytest
+import requests
+
+from src.toolkits.hubspot_toolkit import HubSpotToolkit
+
+
+def _response(status_code: int, body: bytes = b"{}") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "Bad Request" if status_code == 400 else "OK"
+    response.url = "https://api.hubapi.com/crm/v3/objects/contacts/search"
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.mark.unit
+def test_streamed_request_closes_response_on_error_status(monkeypatch):
+    toolkit = HubSpotToolkit()
+    toolkit.api_key = "test-key"
+    response = _response(400, b'{"message": "bad filter"}')
+    monkeypatch.setattr(toolkit.session, "request", lambda *args, **kwargs: response)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        toolkit._make_request("crm/v3/objects/contacts/search", "POST", {}, stream=True)
+
+    assert response.raw.closed
+
+
+@pytest.mark.unit
+def test_streamed_request_returns_open_response_on_success(monkeypatch):
+    toolkit = HubSpotToolkit()
+    toolkit.api_key = "test-key"
+    response = _response(200, b'{"results": []}')
+    monkeypatch.setattr(toolkit.session, "request", lambda *args, **kwargs: response)
+
+    result = toolkit._make_request("crm/v3/objects/contacts/search", "POST", {}, stream=True)
+
+    assert result is response
+    assert not response.raw.closed